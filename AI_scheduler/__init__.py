@@ -6,12 +6,83 @@ from .scheduler import (
     build_schedule,
     render_schedule,
 )
+from .curriculum import (
+    Curriculum,
+    LearnerPlan,
+    Module,
+    PackedSchedule,
+    build_cohort_schedules,
+    build_curriculum_schedule,
+    load_curriculum,
+)
+from .dates import (
+    Availability,
+    DatedItem,
+    load_holidays,
+    materialize_cohort,
+    materialize_dates,
+    render_dated_schedule,
+)
+from .pacing import (
+    ActivitySpec,
+    PacingTable,
+    optimize_cohort_minutes,
+    optimize_weekly_minutes,
+)
+from .review import ReviewBook, apply_cohort_spaced_review, apply_spaced_review
+from .bulk import (
+    export_schedule_to_csv,
+    export_schedule_to_jsonl,
+    write_csv,
+    write_jsonl,
+)
+from .fingerprint import (
+    FingerprintStore,
+    cohort_fingerprints,
+    diff_cohorts,
+    schedule_fingerprints,
+)
+from .shared import CohortDataset, write_cohort_dataset
 from .excel import export_schedule_to_excel
+from .ics import export_schedule_to_ics, iter_ics, write_ics
 
 __all__ = [
     "ScheduledItem",
     "build_ai_schedule",
     "build_schedule",
     "render_schedule",
+    "Curriculum",
+    "LearnerPlan",
+    "Module",
+    "PackedSchedule",
+    "build_cohort_schedules",
+    "build_curriculum_schedule",
+    "load_curriculum",
+    "Availability",
+    "DatedItem",
+    "load_holidays",
+    "materialize_cohort",
+    "materialize_dates",
+    "render_dated_schedule",
+    "ActivitySpec",
+    "PacingTable",
+    "optimize_cohort_minutes",
+    "optimize_weekly_minutes",
+    "ReviewBook",
+    "apply_cohort_spaced_review",
+    "apply_spaced_review",
+    "export_schedule_to_csv",
+    "export_schedule_to_jsonl",
+    "write_csv",
+    "write_jsonl",
+    "FingerprintStore",
+    "cohort_fingerprints",
+    "diff_cohorts",
+    "schedule_fingerprints",
+    "CohortDataset",
+    "write_cohort_dataset",
     "export_schedule_to_excel",
+    "export_schedule_to_ics",
+    "iter_ics",
+    "write_ics",
 ]
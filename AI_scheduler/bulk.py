@@ -0,0 +1,141 @@
+"""Bulk JSON Lines and CSV writers for large schedule exports.
+
+:meth:`ScheduledItem.to_row` builds a dict per row, which is convenient but
+costly when exporting a cohort. These writers pull field tuples straight off
+each item with :func:`operator.attrgetter`, format them with the C-accelerated
+encoders in :mod:`json` and :mod:`csv`, and write in buffered chunks, so large
+exports are bound by I/O rather than per-row Python work.
+"""
+
+from __future__ import annotations
+
+import csv
+import sys
+from itertools import islice
+from json.encoder import encode_basestring_ascii
+from operator import attrgetter
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, TextIO, Tuple, Union
+
+from .dates import DatedItem
+from .scheduler import ROW_FIELDS, ScheduledItem
+
+Row = Union[ScheduledItem, DatedItem]
+
+DATED_FIELDS = ("learner", "date", "start", "end")
+
+_item_values = attrgetter(*ROW_FIELDS)
+_dated_values = attrgetter(*(f"item.{name}" for name in ROW_FIELDS), *DATED_FIELDS)
+
+
+def _chunks(rows: Iterable[Row], size: int) -> Iterator[Tuple[Row, ...]]:
+    iterator = iter(rows)
+    while chunk := tuple(islice(iterator, size)):
+        yield chunk
+
+
+def _fields_and_getter(first: Row):
+    if isinstance(first, DatedItem):
+        return ROW_FIELDS + DATED_FIELDS, _dated_values
+    return ROW_FIELDS, _item_values
+
+
+def _quoted_isoformat(value) -> str:
+    return f'"{value.isoformat()}"'
+
+
+# How each field is pre-encoded before %-formatting into a JSON object.
+_JSON_ENCODERS = {
+    "level": None,
+    "week": None,
+    "duration_minutes": None,
+    "date": _quoted_isoformat,
+    "start": _quoted_isoformat,
+    "end": _quoted_isoformat,
+}
+
+
+def write_jsonl(rows: Iterable[Row], stream: TextIO, chunk_size: int = 5000) -> int:
+    """Write one JSON object per row, returning the number of rows written.
+
+    Rows must be all :class:`ScheduledItem` or all :class:`DatedItem`; dated
+    rows add ``learner``, ``date``, ``start`` and ``end`` (ISO 8601) keys.
+    """
+
+    written = 0
+    template = ""
+    getter = None
+    encoders: Tuple = ()
+    for chunk in _chunks(rows, chunk_size):
+        if getter is None:
+            fields, getter = _fields_and_getter(chunk[0])
+            encoders = tuple(
+                _JSON_ENCODERS.get(name, encode_basestring_ascii) for name in fields
+            )
+            # Integers are formatted with %d; everything else arrives pre-encoded.
+            members = (
+                f'"{name}":%d' if encoder is None else f'"{name}":%s'
+                for name, encoder in zip(fields, encoders)
+            )
+            template = "{" + ",".join(members) + "}\n"
+
+        lines = [
+            template
+            % tuple(
+                value if encoder is None else encoder(value)
+                for encoder, value in zip(encoders, values)
+            )
+            for values in map(getter, chunk)
+        ]
+        stream.write("".join(lines))
+        written += len(chunk)
+    return written
+
+
+def write_csv(rows: Iterable[Row], stream: TextIO, chunk_size: int = 5000) -> int:
+    """Write rows as CSV with a header line, returning the number of rows written.
+
+    The header uses the :class:`ScheduledItem` field names, followed by the
+    dated columns for :class:`DatedItem` rows. Open files with ``newline=""``.
+    """
+
+    writer = csv.writer(stream, lineterminator="\n")
+    written = 0
+    getter = None
+    for chunk in _chunks(rows, chunk_size):
+        if getter is None:
+            fields, getter = _fields_and_getter(chunk[0])
+            writer.writerow(fields)
+        writer.writerows(map(getter, chunk))
+        written += len(chunk)
+    if getter is None:
+        writer.writerow(ROW_FIELDS)
+    return written
+
+
+def export_schedule_to_jsonl(rows: Iterable[Row], path: Optional[Path] = None) -> int:
+    """Write rows as JSON Lines to ``path``, or to stdout when omitted."""
+
+    if path is None:
+        return write_jsonl(rows, sys.stdout)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", buffering=1 << 20) as stream:
+        return write_jsonl(rows, stream)
+
+
+def export_schedule_to_csv(rows: Iterable[Row], path: Optional[Path] = None) -> int:
+    """Write rows as CSV to ``path``, or to stdout when omitted."""
+
+    if path is None:
+        return write_csv(rows, sys.stdout)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="", buffering=1 << 20) as stream:
+        return write_csv(rows, stream)
+
+
+__all__ = [
+    "export_schedule_to_csv",
+    "export_schedule_to_jsonl",
+    "write_csv",
+    "write_jsonl",
+]
@@ -0,0 +1,332 @@
+"""Schedule curricula described as prerequisite graphs.
+
+The fixed generators in :mod:`AI_scheduler.scheduler` walk lessons with a linear
+counter. Here a course is a set of :class:`Module` values whose prerequisites
+form a DAG. Modules are ordered with Kahn's algorithm driven by a priority
+queue, so among the modules that are ready the most important one is taken
+first. They are then packed into study days within each learner's weekly minute
+budget, and the result is an ordinary list of :class:`ScheduledItem` plus the
+codes of any modules that did not fit.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .scheduler import ScheduledItem
+
+PRIORITIES = ("weight", "focus", "critical-path")
+
+
+@dataclass(frozen=True)
+class Module:
+    """A schedulable unit of a curriculum.
+
+    Attributes:
+        code: Unique identifier, used as the ``module`` of scheduled items.
+        minutes: Study time the module needs.
+        level: Course level the module belongs to.
+        prerequisites: Codes of modules that must be scheduled first.
+        weight: Importance used to break ties among ready modules.
+        tags: Focus areas the module serves, e.g. ``("conversation",)``.
+        optional: Optional branches are only scheduled when they match the
+            learner's focus or a required module depends on them.
+        activity: Activity label for the scheduled item.
+        goal: Goal text for the scheduled item; defaults to the code.
+    """
+
+    code: str
+    minutes: int
+    level: int = 1
+    prerequisites: Tuple[str, ...] = ()
+    weight: float = 1.0
+    tags: Tuple[str, ...] = ()
+    optional: bool = False
+    activity: str = "On-demand lesson"
+    goal: str = ""
+
+
+@dataclass(frozen=True)
+class LearnerPlan:
+    """Pacing inputs for scheduling one learner through a curriculum."""
+
+    minutes_per_week: int = 180
+    focus: str = "balanced"
+    priority: str = "weight"
+    days_per_week: int = 5
+
+
+@dataclass(frozen=True)
+class PackedSchedule:
+    """Scheduled items for a curriculum plus the modules that did not fit.
+
+    Attributes:
+        items: Sessions of every module that fits completely.
+        omitted: Codes of modules left out because ``max_weeks`` ran out, in
+            scheduling order. A module is never scheduled in part.
+    """
+
+    items: List[ScheduledItem]
+    omitted: Tuple[str, ...] = ()
+
+
+@dataclass
+class Curriculum:
+    """A validated prerequisite graph of modules.
+
+    The graph is stored as integer-indexed adjacency lists so ordering a
+    curriculum with thousands of modules stays linear in its size.
+    """
+
+    modules: List[Module]
+    _index: Dict[str, int] = field(init=False, repr=False)
+    _children: List[List[int]] = field(init=False, repr=False)
+    _parents: List[List[int]] = field(init=False, repr=False)
+    _orders: Dict[Tuple[str, str], List[int]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._index = {}
+        for position, module in enumerate(self.modules):
+            if module.code in self._index:
+                raise ValueError(f"Duplicate module code: {module.code}")
+            if module.minutes <= 0:
+                raise ValueError(f"Module {module.code} must have positive minutes")
+            self._index[module.code] = position
+
+        self._children = [[] for _ in self.modules]
+        self._parents = [[] for _ in self.modules]
+        for position, module in enumerate(self.modules):
+            for code in module.prerequisites:
+                if code not in self._index:
+                    raise ValueError(f"Module {module.code} requires unknown module {code}")
+                self._parents[position].append(self._index[code])
+                self._children[self._index[code]].append(position)
+
+        self._orders = {}
+        if len(self._order(range(len(self.modules)), [0.0] * len(self.modules))) != len(
+            self.modules
+        ):
+            raise ValueError("Curriculum prerequisites contain a cycle")
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping]) -> "Curriculum":
+        """Build a curriculum from plain mappings such as parsed JSON objects."""
+
+        modules = []
+        for record in records:
+            values = dict(record)
+            values["prerequisites"] = tuple(values.get("prerequisites", ()))
+            values["tags"] = tuple(values.get("tags", ()))
+            modules.append(Module(**values))
+        return cls(modules)
+
+    def _selected(self, focus: str) -> List[int]:
+        """Return required modules, matching optional ones, and their prerequisites."""
+
+        selected = [
+            not module.optional or focus in module.tags for module in self.modules
+        ]
+        stack = [position for position, keep in enumerate(selected) if keep]
+        while stack:
+            for parent in self._parents[stack.pop()]:
+                if not selected[parent]:
+                    selected[parent] = True
+                    stack.append(parent)
+        return [position for position, keep in enumerate(selected) if keep]
+
+    def _scores(self, focus: str, priority: str) -> List[float]:
+        if priority == "weight":
+            return [module.weight for module in self.modules]
+        if priority == "focus":
+            bonus = max((module.weight for module in self.modules), default=0.0) + 1.0
+            return [
+                module.weight + (bonus if focus in module.tags else 0.0)
+                for module in self.modules
+            ]
+        if priority == "critical-path":
+            # Minutes on the longest chain a module unlocks, so long chains start early.
+            remaining = [0.0] * len(self.modules)
+            for position in reversed(self._order(range(len(self.modules)), remaining)):
+                downstream = max(
+                    (remaining[child] for child in self._children[position]), default=0.0
+                )
+                remaining[position] = self.modules[position].minutes + downstream
+            return remaining
+        raise ValueError(f"priority must be one of {', '.join(PRIORITIES)}")
+
+    def _order(self, positions: Iterable[int], scores: Sequence[float]) -> List[int]:
+        """Topologically sort ``positions`` taking the highest score first."""
+
+        members = set(positions)
+        indegree = {
+            position: sum(parent in members for parent in self._parents[position])
+            for position in members
+        }
+        ready = [(-scores[p], p) for p, degree in indegree.items() if degree == 0]
+        heapq.heapify(ready)
+
+        order: List[int] = []
+        while ready:
+            _, position = heapq.heappop(ready)
+            order.append(position)
+            for child in self._children[position]:
+                if child in indegree:
+                    indegree[child] -= 1
+                    if indegree[child] == 0:
+                        heapq.heappush(ready, (-scores[child], child))
+        return order
+
+    def order(self, focus: str = "balanced", priority: str = "weight") -> List[Module]:
+        """Return the modules a learner with ``focus`` takes, in study order.
+
+        Orders are cached per ``(focus, priority)`` so batch runs over a cohort
+        only sort the graph once per distinct learner profile.
+        """
+
+        key = (focus, priority)
+        if key not in self._orders:
+            self._orders[key] = self._order(
+                self._selected(focus), self._scores(focus, priority)
+            )
+        return [self.modules[position] for position in self._orders[key]]
+
+
+def load_curriculum(path: Path) -> Curriculum:
+    """Load a curriculum from a JSON list of module objects."""
+
+    return Curriculum.from_records(json.loads(path.read_text(encoding="utf-8")))
+
+
+def pack_modules(
+    modules: Iterable[Module],
+    minutes_per_week: int,
+    days_per_week: int = 5,
+    max_weeks: Optional[int] = None,
+    min_session: int = 20,
+) -> PackedSchedule:
+    """Pack ordered modules into study days within a weekly minute budget.
+
+    Each study day holds at most ``ceil(minutes_per_week / days_per_week)``
+    minutes and each week at most ``minutes_per_week``. Modules that do not fit
+    in the time left are split across consecutive days as ``(part n)``
+    sessions, but a session shorter than ``min_session`` is never started just
+    to fill a gap. Splits are rebalanced, or the rest of a module waits for the
+    next day it fits in, so the last part is at least ``min_session`` long too.
+    The exception is a remainder longer than a study day but shorter than two
+    ``min_session`` parts: it cannot be split that way and may end with a
+    shorter part, e.g. 21 minutes with 20-minute days. When ``max_weeks`` runs
+    out, the module being packed and all later ones are reported in
+    :attr:`PackedSchedule.omitted` instead.
+    """
+
+    if minutes_per_week <= 0:
+        raise ValueError("minutes_per_week must be greater than zero")
+    if not 1 <= days_per_week <= 7:
+        raise ValueError("days_per_week must be between 1 and 7")
+
+    day_budget = -(-minutes_per_week // days_per_week)
+    min_session = max(1, min(min_session, day_budget))
+    week, day = 1, 1
+    day_left, week_left = day_budget, minutes_per_week
+
+    items: List[ScheduledItem] = []
+    pending = iter(modules)
+    for module in pending:
+        sessions: List[Tuple[int, int, int]] = []
+        remaining = module.minutes
+        while remaining:
+            room = min(day_left, week_left)
+            tail = remaining - min(remaining, room)
+            # A tail too short to rebalance waits for a day the rest fits in.
+            wait = 0 < tail < min_session and remaining < 2 * min_session
+            if room < min(remaining, min_session) or (wait and remaining <= day_budget):
+                day += 1
+                day_left = day_budget
+                if day > days_per_week or week_left < min(remaining, min_session):
+                    week, day = week + 1, 1
+                    week_left = minutes_per_week
+                if max_weeks is not None and week > max_weeks:
+                    break
+                continue
+
+            minutes = min(remaining, room)
+            if 0 < tail < min_session and not wait:
+                # Leave a full-length last part instead of a short tail.
+                minutes = remaining - min_session
+            sessions.append((week, day, minutes))
+            remaining -= minutes
+            day_left -= minutes
+            week_left -= minutes
+
+        if remaining:
+            omitted = (module.code, *(later.code for later in pending))
+            return PackedSchedule(items, omitted)
+
+        for part, (session_week, session_day, minutes) in enumerate(sessions, start=1):
+            label = module.code if len(sessions) == 1 else f"{module.code} (part {part})"
+            items.append(
+                ScheduledItem(
+                    level=module.level,
+                    week=session_week,
+                    day=f"Week{session_week}-Day{session_day}",
+                    activity=module.activity,
+                    module=label,
+                    duration_minutes=minutes,
+                    goal=module.goal or module.code,
+                )
+            )
+
+    return PackedSchedule(items)
+
+
+def build_curriculum_schedule(
+    curriculum: Curriculum,
+    plan: LearnerPlan = LearnerPlan(),
+    max_weeks: Optional[int] = None,
+) -> PackedSchedule:
+    """Order a curriculum for one learner and pack it into study days."""
+
+    return pack_modules(
+        curriculum.order(plan.focus, plan.priority),
+        plan.minutes_per_week,
+        plan.days_per_week,
+        max_weeks,
+    )
+
+
+def build_cohort_schedules(
+    curriculum: Curriculum,
+    plans: Mapping[str, LearnerPlan],
+    max_weeks: Optional[int] = None,
+) -> Dict[str, PackedSchedule]:
+    """Schedule a whole cohort, sorting the graph once per learner profile.
+
+    Learners with identical plans share the same packed result; each learner
+    still gets their own item list.
+    """
+
+    packed: Dict[LearnerPlan, PackedSchedule] = {}
+    schedules: Dict[str, PackedSchedule] = {}
+    for learner, plan in plans.items():
+        if plan not in packed:
+            packed[plan] = build_curriculum_schedule(curriculum, plan, max_weeks)
+        shared = packed[plan]
+        schedules[learner] = PackedSchedule(list(shared.items), shared.omitted)
+    return schedules
+
+
+__all__ = [
+    "Curriculum",
+    "LearnerPlan",
+    "Module",
+    "PRIORITIES",
+    "PackedSchedule",
+    "build_cohort_schedules",
+    "build_curriculum_schedule",
+    "load_curriculum",
+    "pack_modules",
+]
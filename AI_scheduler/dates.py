@@ -0,0 +1,316 @@
+"""Materialize schedule items onto real calendar dates.
+
+Schedules are generated as abstract ``Week{n}-Day{m}`` slots. This module maps
+those slots onto dates starting from a chosen day, skipping holidays and the
+weekdays a learner has blocked, using NumPy business-day arithmetic so a whole
+cohort is shifted with a handful of vectorized calls.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .scheduler import ScheduledItem
+
+WEEKDAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+
+@dataclass(frozen=True)
+class Availability:
+    """Days and hours a learner can study.
+
+    Attributes:
+        weekmask: Seven-character ``"1"``/``"0"`` mask starting on Monday, in the
+            format accepted by :func:`numpy.busday_offset`.
+        holidays: Additional dates the learner is unavailable.
+        day_start: Time of day the first session on a date begins. Further items
+            on the same date are stacked back to back.
+    """
+
+    weekmask: str = "1111111"
+    holidays: Tuple[date, ...] = ()
+    day_start: time = time(hour=9)
+
+    @classmethod
+    def from_weekdays(
+        cls,
+        weekdays: Iterable[str],
+        holidays: Iterable[date] = (),
+        day_start: time = time(hour=9),
+    ) -> "Availability":
+        """Build an availability from weekday names such as ``["Mon", "Wed"]``."""
+
+        selected = {name.strip()[:3].capitalize() for name in weekdays}
+        unknown = selected.difference(WEEKDAY_NAMES)
+        if unknown:
+            raise ValueError(f"Unknown weekday names: {', '.join(sorted(unknown))}")
+        weekmask = "".join("1" if name in selected else "0" for name in WEEKDAY_NAMES)
+        return cls(weekmask=weekmask, holidays=tuple(holidays), day_start=day_start)
+
+
+@dataclass(frozen=True)
+class DatedItem:
+    """A :class:`ScheduledItem` placed on a concrete date and time."""
+
+    item: ScheduledItem
+    date: date
+    start: datetime
+    end: datetime
+    learner: str = ""
+
+
+def parse_day_number(day_label: str) -> int:
+    """Extract the numeric portion from a day label like "Week1-Day3"."""
+
+    for part in day_label.split("-"):
+        if part.startswith("Day"):
+            number = part.replace("Day", "")
+            if number.isdigit():
+                return int(number)
+    return 1
+
+
+def load_holidays(path: Path) -> Tuple[date, ...]:
+    """Read a holiday calendar with one ISO date per line.
+
+    Blank lines and text after ``#`` are ignored, so published calendars can be
+    annotated with the holiday names.
+    """
+
+    holidays = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        value = line.split("#", 1)[0].strip()
+        if value:
+            holidays.append(date.fromisoformat(value))
+    return tuple(holidays)
+
+
+def _nominal_offsets(items: Sequence[ScheduledItem]) -> np.ndarray:
+    """Return the day offset of each item from the schedule start."""
+
+    weeks = np.fromiter((item.week for item in items), dtype=np.int64, count=len(items))
+    days = np.fromiter(
+        (parse_day_number(item.day) for item in items), dtype=np.int64, count=len(items)
+    )
+    return (weeks - 1) * 7 + days - 1
+
+
+def materialize_cohort(
+    schedules: Mapping[str, Sequence[ScheduledItem]],
+    start: date,
+    availability: Optional[Mapping[str, Availability]] = None,
+    holidays: Iterable[date] = (),
+) -> Dict[str, List[DatedItem]]:
+    """Place every learner's schedule on real dates.
+
+    Each occupied ``Week{n}-Day{m}`` slot starts from its nominal date
+    (``start + (week - 1) * 7 + day - 1``) rolled forward past shared holidays,
+    learner holidays and weekdays masked out for that learner. If that study day
+    is already taken by an earlier slot, the slot moves on to the next free
+    study day, so every slot keeps a date of its own without consuming days for
+    slots the schedule never uses. A slot's items are stacked from the learner's
+    ``day_start`` in schedule order.
+
+    Args:
+        schedules: Schedule per learner identifier.
+        start: Date of ``Week1-Day1``.
+        availability: Optional per-learner availability. Learners without an
+            entry are available every day from 09:00.
+        holidays: Holiday calendar shared by the whole cohort.
+
+    Raises:
+        ValueError: If a slot's items would run past midnight.
+    """
+
+    availability = availability or {}
+    default = Availability()
+    learners = list(schedules)
+    shared_holidays = tuple(holidays)
+
+    counts = np.array([len(schedules[learner]) for learner in learners], dtype=np.int64)
+    flat: List[ScheduledItem] = [item for learner in learners for item in schedules[learner]]
+    if not flat:
+        return {learner: [] for learner in learners}
+
+    learner_index = np.repeat(np.arange(len(learners)), counts)
+    slots = _nominal_offsets(flat)
+    study_days = np.empty(len(flat), dtype=np.int64)
+    dates = np.empty(len(flat), dtype="datetime64[D]")
+
+    # Learners sharing the same mask and holidays are placed with a single call.
+    group_keys: Dict[Tuple[str, Tuple[date, ...]], int] = {}
+    learner_group = np.empty(len(learners), dtype=np.int64)
+    for position, learner in enumerate(learners):
+        rules = availability.get(learner, default)
+        key = (rules.weekmask, tuple(sorted(set(shared_holidays + rules.holidays))))
+        learner_group[position] = group_keys.setdefault(key, len(group_keys))
+
+    # Sort rows by group once so each group is a contiguous slice.
+    row_group = learner_group[learner_index]
+    by_group = np.argsort(row_group, kind="stable")
+    group_sizes = np.bincount(row_group, minlength=len(group_keys))
+    bounds = np.concatenate(([0], np.cumsum(group_sizes)))
+    first_day = np.datetime64(start, "D")
+    calendars = [
+        np.busdaycalendar(
+            weekmask=weekmask, holidays=np.array(group_holidays, dtype="datetime64[D]")
+        )
+        for weekmask, group_holidays in group_keys
+    ]
+
+    # Index of each slot's rolled-forward nominal date among the study days.
+    for group, calendar in enumerate(calendars):
+        rows = by_group[bounds[group] : bounds[group + 1]]
+        first_study_day = np.busday_offset(first_day, 0, "forward", busdaycal=calendar)
+        nominal = np.busday_offset(
+            first_day + slots[rows], 0, roll="forward", busdaycal=calendar
+        )
+        study_days[rows] = np.busday_count(first_study_day, nominal, busdaycal=calendar)
+
+    # Slot k of a learner (dense rank) needs a study day after slot k - 1, so it
+    # lands on rank + running max of (nominal study day - rank).
+    order = np.lexsort((slots, learner_index))
+    sorted_learners = learner_index[order]
+    new_learner = np.r_[True, sorted_learners[1:] != sorted_learners[:-1]]
+    new_slot = new_learner | np.r_[True, slots[order][1:] != slots[order][:-1]]
+    rank = np.cumsum(new_slot) - 1
+    rank -= np.maximum.accumulate(np.where(new_learner, rank, 0))
+    lag = study_days[order] - rank
+    shift = sorted_learners * (int(lag.max() - lag.min()) + 1)
+    placed = np.empty_like(study_days)
+    placed[order] = rank + np.maximum.accumulate(lag + shift) - shift
+
+    for group, calendar in enumerate(calendars):
+        rows = by_group[bounds[group] : bounds[group + 1]]
+        dates[rows] = np.busday_offset(
+            first_day, placed[rows], roll="forward", busdaycal=calendar
+        )
+
+    durations = np.fromiter(
+        (item.duration_minutes for item in flat), dtype=np.int64, count=len(flat)
+    )
+    day_starts = np.array(
+        [
+            availability.get(learner, default).day_start.hour * 60
+            + availability.get(learner, default).day_start.minute
+            for learner in learners
+        ],
+        dtype=np.int64,
+    )
+
+    # Stack items sharing a (learner, date) back to back, keeping schedule order.
+    order = np.lexsort((np.arange(len(flat)), dates, learner_index))
+    sorted_minutes = durations[order]
+    running = np.cumsum(sorted_minutes)
+    sorted_keys = np.stack([learner_index[order], dates[order].astype(np.int64)])
+    new_group = np.ones(len(flat), dtype=bool)
+    new_group[1:] = np.any(sorted_keys[:, 1:] != sorted_keys[:, :-1], axis=0)
+    group_base = np.maximum.accumulate(np.where(new_group, running - sorted_minutes, 0))
+    offsets = np.empty_like(durations)
+    offsets[order] = running - sorted_minutes - group_base
+
+    start_minutes = offsets + day_starts[learner_index]
+    overflow = start_minutes + durations > 24 * 60
+    if overflow.any():
+        position = int(np.argmax(overflow))
+        raise ValueError(
+            f"{flat[position].day} does not fit between day_start and midnight"
+        )
+    starts = dates.astype("datetime64[m]") + start_minutes.astype("timedelta64[m]")
+    ends = starts + durations.astype("timedelta64[m]")
+
+    date_values = dates.astype(object)
+    start_values = starts.astype(object)
+    end_values = ends.astype(object)
+
+    result: Dict[str, List[DatedItem]] = {learner: [] for learner in learners}
+    for position, item in enumerate(flat):
+        learner = learners[learner_index[position]]
+        result[learner].append(
+            DatedItem(
+                item=item,
+                date=date_values[position],
+                start=start_values[position],
+                end=end_values[position],
+                learner=learner,
+            )
+        )
+    return result
+
+
+def materialize_dates(
+    items: Iterable[ScheduledItem],
+    start: date,
+    availability: Optional[Availability] = None,
+    holidays: Iterable[date] = (),
+) -> List[DatedItem]:
+    """Place a single learner's schedule on real dates.
+
+    See :func:`materialize_cohort` for the placement rules. A five-day plan on
+    a Monday-to-Friday mask fills consecutive weekdays:
+
+    >>> from AI_scheduler.scheduler import build_ai_schedule
+    >>> weekdays = Availability.from_weekdays(["Mon", "Tue", "Wed", "Thu", "Fri"])
+    >>> rows = materialize_dates(build_ai_schedule(), date(2026, 4, 27), weekdays)
+    >>> days = sorted({row.date for row in rows})
+    >>> len(days), days[0].isoformat(), days[-1].isoformat()
+    (30, '2026-04-27', '2026-06-05')
+    >>> all(day.weekday() < 5 for day in days)
+    True
+    """
+
+    rules = {"": availability} if availability is not None else None
+    return materialize_cohort({"": list(items)}, start, rules, holidays)[""]
+
+
+def render_dated_schedule(rows: Iterable[DatedItem]) -> str:
+    """Render a materialized schedule as a Markdown-friendly table."""
+
+    header = [
+        "Date",
+        "Start",
+        "Level",
+        "Week",
+        "Day",
+        "Activity",
+        "Module",
+        "Duration(min)",
+        "Goal",
+    ]
+    lines = [" | ".join(header), " | ".join(["---"] * len(header))]
+
+    for row in rows:
+        item = row.item
+        lines.append(
+            " | ".join(
+                [
+                    row.date.isoformat(),
+                    row.start.strftime("%H:%M"),
+                    str(item.level),
+                    str(item.week),
+                    item.day,
+                    item.activity,
+                    item.module,
+                    str(item.duration_minutes),
+                    item.goal,
+                ]
+            )
+        )
+
+    return "\n".join(lines)
+
+
+__all__ = [
+    "Availability",
+    "DatedItem",
+    "load_holidays",
+    "materialize_cohort",
+    "materialize_dates",
+    "parse_day_number",
+    "render_dated_schedule",
+]
@@ -1,16 +1,21 @@
 """Utilities for exporting the generated schedule to Excel."""
 
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Union
 
+from .dates import DatedItem
 from .scheduler import ScheduledItem
 
 
-def export_schedule_to_excel(rows: Iterable[ScheduledItem], path: Path) -> None:
+def export_schedule_to_excel(
+    rows: Iterable[Union[ScheduledItem, DatedItem]], path: Path
+) -> None:
     """Write schedule rows to an Excel workbook.
 
     Args:
-        rows: Iterable of :class:`ScheduledItem` values to export.
+        rows: Iterable of :class:`ScheduledItem` values to export, or
+            :class:`DatedItem` values to include the materialized date and start
+            time as leading columns.
         path: Location for the resulting ``.xlsx`` file. Parent directories are
             created automatically.
     """
@@ -18,25 +23,32 @@ def export_schedule_to_excel(rows: Iterable[ScheduledItem], path: Path) -> None:
     from openpyxl import Workbook
     from openpyxl.utils import get_column_letter
 
+    rows = list(rows)
+    dated = bool(rows) and isinstance(rows[0], DatedItem)
+
     workbook = Workbook()
     sheet = workbook.active
     sheet.title = "Schedule"
 
     headers = ["Level", "Week", "Day", "Activity", "Module", "Duration(min)", "Goal"]
+    if dated:
+        headers = ["Date", "Start"] + headers
     sheet.append(headers)
 
-    for item in rows:
-        sheet.append(
-            [
-                item.level,
-                item.week,
-                item.day,
-                item.activity,
-                item.module,
-                item.duration_minutes,
-                item.goal,
-            ]
-        )
+    for row in rows:
+        item = row.item if dated else row
+        values = [
+            item.level,
+            item.week,
+            item.day,
+            item.activity,
+            item.module,
+            item.duration_minutes,
+            item.goal,
+        ]
+        if dated:
+            values = [row.date, row.start.strftime("%H:%M")] + values
+        sheet.append(values)
 
     for column_index, header in enumerate(headers, start=1):
         max_length = len(header)
@@ -0,0 +1,229 @@
+"""Content fingerprints for schedules and fast cohort change detection.
+
+Every row gets a short BLAKE2b digest of its fields, and every learner's
+schedule a digest of its ordered row digests. Both are stored in a directory
+next to a generated cohort: a compact ``index.jsonl`` maps each learner to
+their schedule digest, and each learner's row digests live in their own file
+under ``rows/``. A later run compares the indexes first and only reads and diffs the
+row files of learners whose schedule actually changed, so downstream re-exports
+and notifications are limited to those plans.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from hashlib import blake2b
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Union
+
+from .dates import DatedItem
+from .scheduler import ROW_FIELDS, ScheduledItem
+
+FORMAT_VERSION = 1
+INDEX_NAME = "index.jsonl"
+DIGEST_SIZE = 8
+
+Row = Union[ScheduledItem, DatedItem]
+
+# learner -> {"schedule": digest, "rows": {row key: digest}}
+Fingerprints = Dict[str, Dict]
+
+
+def _values(row: Row) -> List[str]:
+    if isinstance(row, DatedItem):
+        item = row.item
+        extra = [row.date.isoformat(), row.start.isoformat(), row.end.isoformat()]
+    else:
+        item, extra = row, []
+    return [str(getattr(item, name)) for name in ROW_FIELDS] + extra
+
+
+def row_fingerprint(row: Row) -> str:
+    """Return a stable hex digest of a row's content."""
+
+    payload = "\x1f".join(_values(row)).encode("utf-8")
+    return blake2b(payload, digest_size=DIGEST_SIZE).hexdigest()
+
+
+def row_key(row: Row, occurrence: int = 0) -> str:
+    """Return the slot a row occupies, used to match rows across versions.
+
+    Rows are identified by day label and activity; ``occurrence`` separates
+    repeated activities on the same day, e.g. split curriculum modules.
+    """
+
+    item = row.item if isinstance(row, DatedItem) else row
+    key = f"{item.day}/{item.activity}"
+    return f"{key}#{occurrence}" if occurrence else key
+
+
+def schedule_fingerprints(rows: Iterable[Row]) -> Dict:
+    """Return the schedule digest and per-row digests for one learner."""
+
+    schedule = blake2b(digest_size=DIGEST_SIZE)
+    row_digests: Dict[str, str] = {}
+    seen: Dict[str, int] = {}
+    for row in rows:
+        digest = row_fingerprint(row)
+        schedule.update(bytes.fromhex(digest))
+        base = row_key(row)
+        occurrence = seen.get(base, 0)
+        seen[base] = occurrence + 1
+        row_digests[row_key(row, occurrence)] = digest
+    return {"schedule": schedule.hexdigest(), "rows": row_digests}
+
+
+def cohort_fingerprints(schedules: Mapping[str, Sequence[Row]]) -> Fingerprints:
+    """Fingerprint every learner's schedule in a cohort."""
+
+    return {learner: schedule_fingerprints(rows) for learner, rows in schedules.items()}
+
+
+def _row_file(directory: Path, learner: str) -> Path:
+    name = blake2b(learner.encode("utf-8"), digest_size=16).hexdigest()
+    return directory / "rows" / f"{name}.json"
+
+
+def _replace_text(path: Path, text: str) -> None:
+    """Write ``text`` to a temporary file and rename it over ``path``."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    descriptor, temporary = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(descriptor, "w", encoding="utf-8") as stream:
+            stream.write(text)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def _write_rows(directory: Path, learner: str, fingerprints: Dict) -> None:
+    document = {"learner": learner, "rows": fingerprints["rows"]}
+    text = json.dumps(document, separators=(",", ":"))
+    _replace_text(_row_file(directory, learner), text)
+
+
+def _index_line(learner: str, schedule: str) -> str:
+    entry = {"version": FORMAT_VERSION, "learner": learner, "schedule": schedule}
+    return json.dumps(entry, separators=(",", ":")) + "\n"
+
+
+def save_fingerprints(fingerprints: Fingerprints, directory: Path) -> None:
+    """Write a cohort's fingerprints as an index plus one row file per learner.
+
+    The index is written in one pass and replaces any previous one, and row
+    files of learners no longer in ``fingerprints`` are removed.
+    """
+
+    for learner, learner_fingerprints in fingerprints.items():
+        _write_rows(directory, learner, learner_fingerprints)
+    index = "".join(
+        _index_line(learner, learner_fingerprints["schedule"])
+        for learner, learner_fingerprints in fingerprints.items()
+    )
+    _replace_text(directory / INDEX_NAME, index)
+
+    current = {_row_file(directory, learner).name for learner in fingerprints}
+    for path in (directory / "rows").glob("*.json"):
+        if path.name not in current:
+            path.unlink()
+
+
+def update_fingerprints(directory: Path, learner: str, fingerprints: Dict) -> None:
+    """Add or replace one learner in a fingerprint directory.
+
+    The learner's row file is replaced atomically and one entry is appended to
+    the index, so fingerprinting a cohort one learner at a time stays linear
+    and concurrent runs for different learners do not lose each other's
+    entries. Later entries for a learner win when the index is read.
+    """
+
+    _write_rows(directory, learner, fingerprints)
+    line = _index_line(learner, fingerprints["schedule"]).encode("utf-8")
+    descriptor = os.open(
+        directory / INDEX_NAME, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+    )
+    try:
+        # A single append of one short line is not interleaved with others.
+        os.write(descriptor, line)
+    finally:
+        os.close(descriptor)
+
+
+class FingerprintStore:
+    """Fingerprints written by :func:`save_fingerprints` or
+    :func:`update_fingerprints`.
+
+    Opening a store reads only the index of schedule digests; row digests are
+    read per learner on demand.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.schedules: Dict[str, str] = {}
+        with (directory / INDEX_NAME).open(encoding="utf-8") as stream:
+            for line in stream:
+                entry = json.loads(line)
+                if entry.get("version") != FORMAT_VERSION:
+                    raise ValueError(
+                        f"Unsupported fingerprint index version: {entry.get('version')}"
+                    )
+                self.schedules[entry["learner"]] = entry["schedule"]
+
+    def rows(self, learner: str) -> Dict[str, str]:
+        """Return the row digests of one learner, keyed by row key."""
+
+        if learner not in self.schedules:
+            raise KeyError(learner)
+        path = _row_file(self.directory, learner)
+        return json.loads(path.read_text(encoding="utf-8"))["rows"]
+
+
+def diff_cohorts(old: FingerprintStore, new: FingerprintStore) -> Iterator[Dict]:
+    """Yield one compact change record per learner whose plan changed.
+
+    Learners are compared by schedule digest first; row files are only read for
+    learners whose digest differs. Records look like::
+
+        {"learner": "alice", "change": "changed",
+         "added": [...], "removed": [...], "changed": [...]}
+
+    with ``change`` one of ``"added"``, ``"removed"`` or ``"changed"``. Row
+    lists hold row keys and are only present for ``"changed"`` learners.
+    """
+
+    for learner in sorted(old.schedules.keys() | new.schedules.keys()):
+        before: Optional[str] = old.schedules.get(learner)
+        after: Optional[str] = new.schedules.get(learner)
+        if before is None:
+            yield {"learner": learner, "change": "added"}
+        elif after is None:
+            yield {"learner": learner, "change": "removed"}
+        elif before != after:
+            old_rows, new_rows = old.rows(learner), new.rows(learner)
+            yield {
+                "learner": learner,
+                "change": "changed",
+                "added": sorted(new_rows.keys() - old_rows.keys()),
+                "removed": sorted(old_rows.keys() - new_rows.keys()),
+                "changed": sorted(
+                    key
+                    for key in old_rows.keys() & new_rows.keys()
+                    if old_rows[key] != new_rows[key]
+                ),
+            }
+
+
+__all__ = [
+    "FingerprintStore",
+    "cohort_fingerprints",
+    "diff_cohorts",
+    "row_fingerprint",
+    "row_key",
+    "save_fingerprints",
+    "schedule_fingerprints",
+    "update_fingerprints",
+]
@@ -0,0 +1,267 @@
+"""Stream schedules to iCalendar (``.ics``) for learners' calendar apps.
+
+Events are written one ``VEVENT`` at a time so large cohorts never build the
+whole document in memory. Each event gets a UID derived from the learner,
+module and day label, so regenerating a plan keeps the same identity in
+subscribed calendars. A small manifest of per-UID content digests and
+``SEQUENCE`` numbers lets later exports bump only the events that changed and
+emit cancellations for the ones that disappeared.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+
+from .dates import DatedItem, parse_day_number
+from .scheduler import ScheduledItem
+
+PRODID = "-//AI Scheduler//Study plan//EN"
+UID_DOMAIN = "ai-scheduler"
+
+# UID -> (content digest, SEQUENCE number last published, DTSTART line).
+Manifest = Dict[str, Tuple[str, int, str]]
+
+Row = Union[ScheduledItem, DatedItem]
+
+
+def event_uid(learner: str, item: ScheduledItem) -> str:
+    """Return the stable UID for ``item`` in ``learner``'s calendar."""
+
+    key = f"{learner}\x1f{item.module}\x1f{item.day}".encode("utf-8")
+    return f"{hashlib.sha1(key).hexdigest()}@{UID_DOMAIN}"
+
+
+def _escape(value: str) -> str:
+    """Escape a TEXT property value as required by RFC 5545."""
+
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """Fold a content line to 75 octets, terminated by CRLF."""
+
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line + "\r\n"
+
+    parts: List[str] = []
+    current = ""
+    limit = 75
+    for char in line:
+        if len((current + char).encode("utf-8")) > limit:
+            parts.append(current)
+            current = ""
+            limit = 74  # continuation lines start with a space
+        current += char
+    parts.append(current)
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _format_utc(moment: datetime) -> str:
+    return moment.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _event_times(row: Row, start: Optional[date]) -> Tuple[str, str]:
+    """Return DTSTART/DTEND content lines for a row."""
+
+    if isinstance(row, DatedItem):
+        return (
+            f"DTSTART:{row.start.strftime('%Y%m%dT%H%M%S')}",
+            f"DTEND:{row.end.strftime('%Y%m%dT%H%M%S')}",
+        )
+    if start is None:
+        raise ValueError("start is required to export undated ScheduledItem rows")
+
+    # Undated rows become all-day events on their nominal date.
+    offset = (row.week - 1) * 7 + parse_day_number(row.day) - 1
+    event_date = start + timedelta(days=offset)
+    return (
+        f"DTSTART;VALUE=DATE:{event_date.strftime('%Y%m%d')}",
+        f"DTEND;VALUE=DATE:{(event_date + timedelta(days=1)).strftime('%Y%m%d')}",
+    )
+
+
+def _event_body(row: Row, start: Optional[date]) -> List[str]:
+    """Return the content lines that describe an event, excluding identity."""
+
+    item = row.item if isinstance(row, DatedItem) else row
+    dtstart, dtend = _event_times(row, start)
+    description = (
+        f"{item.goal}\n"
+        f"Level {item.level}, {item.day}, {item.duration_minutes} min"
+    )
+    return [
+        dtstart,
+        dtend,
+        f"SUMMARY:{_escape(f'{item.activity}: {item.module}')}",
+        f"DESCRIPTION:{_escape(description)}",
+        f"CATEGORIES:{_escape(item.activity)}",
+    ]
+
+
+def _vevent(uid: str, sequence: int, dtstamp: str, body: List[str], status: str) -> str:
+    lines = ["BEGIN:VEVENT", f"UID:{uid}", f"DTSTAMP:{dtstamp}", f"SEQUENCE:{sequence}"]
+    lines.extend(body)
+    lines.append(f"STATUS:{status}")
+    lines.append("END:VEVENT")
+    return "".join(_fold(line) for line in lines)
+
+
+def iter_ics(
+    rows: Iterable[Row],
+    learner: str = "",
+    start: Optional[date] = None,
+    manifest: Optional[Manifest] = None,
+    changes_only: bool = False,
+    calendar_name: str = "AI study plan",
+    dtstamp: Optional[datetime] = None,
+) -> Iterator[str]:
+    """Yield an iCalendar document chunk by chunk.
+
+    Args:
+        rows: :class:`DatedItem` values (timed events) or :class:`ScheduledItem`
+            values (all-day events on their nominal date, requires ``start``).
+        learner: Learner identifier mixed into each event UID.
+        start: Date of ``Week1-Day1`` for undated rows.
+        manifest: Digests and sequence numbers from the previous export. It is
+            updated in place: changed events get their ``SEQUENCE`` bumped and
+            events missing from ``rows`` are emitted as cancelled and dropped.
+        changes_only: When set, skip events whose content is unchanged since
+            the manifest was written so only the delta is published.
+        calendar_name: Value for ``X-WR-CALNAME``.
+        dtstamp: Timestamp for ``DTSTAMP``; defaults to the current UTC time.
+
+    Yields:
+        The calendar header, one string per ``VEVENT``, and the footer, each
+        already folded and CRLF-terminated.
+    """
+
+    stamp = _format_utc(dtstamp or datetime.now(timezone.utc))
+    previous: Manifest = dict(manifest) if manifest is not None else {}
+    current: Manifest = {}
+
+    yield "".join(
+        _fold(line)
+        for line in [
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            f"PRODID:{PRODID}",
+            "CALSCALE:GREGORIAN",
+            f"X-WR-CALNAME:{_escape(calendar_name)}",
+        ]
+    )
+
+    for row in rows:
+        item = row.item if isinstance(row, DatedItem) else row
+        uid = event_uid(learner, item)
+        body = _event_body(row, start)
+        digest = hashlib.sha1("\n".join(body).encode("utf-8")).hexdigest()
+
+        known = previous.pop(uid, None)
+        if known is None:
+            sequence, changed = 0, True
+        elif known[0] == digest:
+            sequence, changed = known[1], False
+        else:
+            sequence, changed = known[1] + 1, True
+        current[uid] = (digest, sequence, body[0])
+
+        if changed or not changes_only:
+            yield _vevent(uid, sequence, stamp, body, "CONFIRMED")
+
+    # Anything left in the previous manifest was removed from the plan.
+    for uid, (_, sequence, dtstart) in previous.items():
+        yield _vevent(uid, sequence + 1, stamp, [dtstart], "CANCELLED")
+
+    yield _fold("END:VCALENDAR")
+
+    if manifest is not None:
+        manifest.clear()
+        manifest.update(current)
+
+
+def write_ics(
+    rows: Iterable[Row],
+    stream: TextIO,
+    learner: str = "",
+    start: Optional[date] = None,
+    manifest: Optional[Manifest] = None,
+    changes_only: bool = False,
+) -> None:
+    """Stream an iCalendar document to an open text stream.
+
+    Open files with ``newline=""`` so the CRLF line endings survive unchanged.
+    See :func:`iter_ics` for the meaning of the arguments.
+    """
+
+    for chunk in iter_ics(
+        rows, learner=learner, start=start, manifest=manifest, changes_only=changes_only
+    ):
+        stream.write(chunk)
+
+
+def load_manifest(path: Path) -> Manifest:
+    """Load an ``.ics`` manifest, returning an empty one if it does not exist."""
+
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {uid: (entry[0], int(entry[1]), entry[2]) for uid, entry in data.items()}
+
+
+def save_manifest(manifest: Manifest, path: Path) -> None:
+    """Persist an ``.ics`` manifest next to the exported calendar."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(manifest, sort_keys=True), encoding="utf-8")
+
+
+def export_schedule_to_ics(
+    rows: Iterable[Row],
+    path: Path,
+    learner: str = "",
+    start: Optional[date] = None,
+    manifest_path: Optional[Path] = None,
+    changes_only: bool = False,
+) -> None:
+    """Write schedule rows to an ``.ics`` file.
+
+    Args:
+        rows: Rows to export; see :func:`iter_ics`.
+        path: Location for the ``.ics`` file. Parent directories are created
+            automatically.
+        learner: Learner identifier mixed into each event UID.
+        start: Date of ``Week1-Day1`` for undated rows.
+        manifest_path: Optional JSON manifest tracking published digests and
+            sequence numbers. It is read before and rewritten after the export.
+        changes_only: Only emit new, changed and cancelled events. Requires
+            ``manifest_path``.
+    """
+
+    if changes_only and manifest_path is None:
+        raise ValueError("changes_only requires a manifest_path")
+    manifest = load_manifest(manifest_path) if manifest_path else None
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as stream:
+        write_ics(rows, stream, learner, start, manifest, changes_only)
+    if manifest_path:
+        save_manifest(manifest, manifest_path)
+
+
+__all__ = [
+    "event_uid",
+    "export_schedule_to_ics",
+    "iter_ics",
+    "load_manifest",
+    "save_manifest",
+    "write_ics",
+]
@@ -0,0 +1,210 @@
+"""Split a learner's weekly minutes across activities with a knapsack DP.
+
+Each weekly activity may be skipped or given between its minimum length and
+``max_sessions`` sessions of its maximum length, in fixed minute steps; required
+activities such as the lesson are never skipped. Coverage of an activity grows with the
+square root of its share of the maximum, so the optimizer prefers spreading time
+over maxing out one activity, and the weighted sum is maximized without ever
+exceeding the weekly budget.
+
+The DP table for a set of activities answers every budget up to the one it was
+built for, so a single table serves a whole cohort: allocations for many
+learners are recovered with one vectorized backtrack.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ActivitySpec:
+    """Session limits and importance of one weekly activity.
+
+    Required activities always get at least ``min_minutes``; a weekly budget too
+    small for them is rejected instead of silently dropping them. An activity
+    can take up to ``max_sessions`` sessions of ``max_minutes`` a week, so large
+    budgets are used instead of capping every session.
+    """
+
+    name: str
+    weight: float
+    min_minutes: int
+    max_minutes: int
+    required: bool = False
+    max_sessions: int = 1
+
+    def sessions(self, minutes: int, step: int = 5) -> List[int]:
+        """Split ``minutes`` into the fewest sessions of at most ``max_minutes``.
+
+        Sessions differ by at most one ``step``.
+        """
+
+        count = max(1, -(-minutes // self.max_minutes))
+        units = minutes // step
+        return [(units + index) // count * step for index in range(count)]
+
+
+# Session caps follow the heuristic pacing rule; two sessions a week each cover
+# budgets beyond the app's 600-minute slider.
+WEEKLY_ACTIVITIES: Tuple[ActivitySpec, ...] = (
+    ActivitySpec("On-demand lesson", 3.0, 20, 90, required=True, max_sessions=2),
+    ActivitySpec("Quiz", 2.0, 10, 80, max_sessions=2),
+    ActivitySpec("AI review / refresh", 1.5, 10, 30, max_sessions=2),
+    ActivitySpec("Focus practice", 2.0, 20, 90, max_sessions=2),
+    ActivitySpec("Integrated check", 1.0, 20, 60, max_sessions=2),
+)
+
+# Weight multipliers applied to WEEKLY_ACTIVITIES for each focus area.
+FOCUS_MULTIPLIERS: Dict[str, Dict[str, float]] = {
+    "conversation": {"Focus practice": 1.5, "Integrated check": 1.2},
+    "reading": {"On-demand lesson": 1.2, "Focus practice": 1.3},
+    "exam": {"Quiz": 1.5, "Integrated check": 1.5},
+    "balanced": {},
+}
+
+
+# Minutes a week the optimizer can place; larger budgets leave the rest unused.
+MAX_WEEKLY_MINUTES = sum(
+    spec.max_minutes * spec.max_sessions for spec in WEEKLY_ACTIVITIES
+)
+
+
+def weekly_activities(focus_area: str = "balanced") -> Tuple[ActivitySpec, ...]:
+    """Return the weekly activity specs weighted for ``focus_area``."""
+
+    multipliers = FOCUS_MULTIPLIERS.get(focus_area, FOCUS_MULTIPLIERS["balanced"])
+    return tuple(
+        ActivitySpec(
+            spec.name,
+            spec.weight * multipliers.get(spec.name, 1.0),
+            spec.min_minutes,
+            spec.max_minutes,
+            spec.required,
+            spec.max_sessions,
+        )
+        for spec in WEEKLY_ACTIVITIES
+    )
+
+
+class PacingTable:
+    """Bounded-knapsack DP over session lengths for a fixed set of activities."""
+
+    def __init__(
+        self, activities: Sequence[ActivitySpec], max_minutes: int, step: int = 5
+    ) -> None:
+        if step <= 0:
+            raise ValueError("step must be greater than zero")
+        self.activities = tuple(activities)
+        self.step = step
+        self.units = max_minutes // step
+        self.min_minutes = sum(
+            -(-spec.min_minutes // step) * step
+            for spec in self.activities
+            if spec.required
+        )
+
+        capacity = np.arange(self.units + 1)
+        dp = np.zeros(self.units + 1)
+        self._choices: List[np.ndarray] = []
+        for spec in self.activities:
+            low = -(-spec.min_minutes // step)
+            high = spec.max_minutes * spec.max_sessions // step
+            options = np.arange(max(low, 1), high + 1)
+            if not spec.required:
+                options = np.concatenate(([0], options))
+            values = spec.weight * np.sqrt(options * step / spec.max_minutes)
+
+            # candidates[k, b]: best value with capacity b when this activity uses options[k].
+            candidates = np.full((len(options), self.units + 1), -np.inf)
+            for k, option in enumerate(options):
+                if option <= self.units:
+                    candidates[k, option:] = dp[: self.units + 1 - option] + values[k]
+            best = candidates.argmax(axis=0)
+            dp = candidates[best, capacity]
+            self._choices.append(options[best])
+        self._values = dp
+
+    def allocate_many(self, budgets: Sequence[int]) -> np.ndarray:
+        """Return minutes per activity for each weekly budget.
+
+        Args:
+            budgets: Weekly minutes per learner. Each must cover the required
+                activities and not exceed the budget the table was built for.
+
+        Returns:
+            Integer array of shape ``(len(budgets), len(activities))``.
+        """
+
+        remaining = np.asarray(budgets, dtype=np.int64) // self.step
+        if remaining.size and (remaining.min() < 0 or remaining.max() > self.units):
+            raise ValueError("budgets must be between zero and the table's max_minutes")
+        if remaining.size and np.isneginf(self._values[remaining]).any():
+            raise ValueError(
+                f"weekly budget must be at least {self.min_minutes} minutes to fit "
+                "the required activities"
+            )
+
+        minutes = np.zeros((remaining.size, len(self.activities)), dtype=np.int64)
+        for index in range(len(self.activities) - 1, -1, -1):
+            chosen = self._choices[index][remaining]
+            minutes[:, index] = chosen * self.step
+            remaining = remaining - chosen
+        return minutes
+
+    def allocate(self, budget: int) -> Dict[str, int]:
+        """Return the optimal minutes per activity name for one weekly budget."""
+
+        row = self.allocate_many([budget])[0]
+        return {spec.name: int(value) for spec, value in zip(self.activities, row)}
+
+
+@lru_cache(maxsize=64)
+def pacing_table(
+    activities: Tuple[ActivitySpec, ...], max_minutes: int, step: int = 5
+) -> PacingTable:
+    """Return a cached :class:`PacingTable` so equal budgets share one DP."""
+
+    return PacingTable(activities, max_minutes, step)
+
+
+def optimize_weekly_minutes(
+    available_minutes_per_week: int, focus_area: str = "balanced"
+) -> Dict[str, int]:
+    """Split one learner's weekly minutes across the weekly activities."""
+
+    if available_minutes_per_week <= 0:
+        raise ValueError("available_minutes_per_week must be greater than zero")
+    table = pacing_table(weekly_activities(focus_area), available_minutes_per_week)
+    return table.allocate(available_minutes_per_week)
+
+
+def optimize_cohort_minutes(
+    budgets: Sequence[int], focus_area: str = "balanced"
+) -> np.ndarray:
+    """Split weekly minutes for many learners sharing a focus area.
+
+    One DP table sized for the largest budget serves every learner.
+    """
+
+    budgets = np.asarray(budgets, dtype=np.int64)
+    if budgets.size == 0:
+        return np.zeros((0, len(WEEKLY_ACTIVITIES)), dtype=np.int64)
+    table = pacing_table(weekly_activities(focus_area), int(budgets.max()))
+    return table.allocate_many(budgets)
+
+
+__all__ = [
+    "ActivitySpec",
+    "PacingTable",
+    "MAX_WEEKLY_MINUTES",
+    "WEEKLY_ACTIVITIES",
+    "optimize_cohort_minutes",
+    "optimize_weekly_minutes",
+    "pacing_table",
+    "weekly_activities",
+]
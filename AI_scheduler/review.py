@@ -0,0 +1,371 @@
+"""Spaced-repetition planning for the AI review days.
+
+The generators emit review slots ("Buffer / AI review", "AI review / refresh")
+that simply revisit the current lesson. :class:`ReviewBook` instead tracks SM-2
+memory state for every (learner, module) pair in flat NumPy columns, so interval
+updates and due-date queries run as array operations over a whole cohort.
+:func:`apply_cohort_spaced_review` uses a book to decide which earlier modules
+each review day in a cohort's schedules should cover, querying the book once
+per day for the whole cohort.
+
+Days are plain integers (for example ``date.toordinal()`` or days since the
+plan start); the book never needs calendar dates.
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .dates import DatedItem, parse_day_number
+from .scheduler import ScheduledItem
+
+REVIEW_ACTIVITIES = ("Buffer / AI review", "AI review / refresh")
+LESSON_ACTIVITIES = ("On-demand lesson",)
+
+Row = Union[ScheduledItem, DatedItem]
+
+INITIAL_EASINESS = 2.5
+MIN_EASINESS = 1.3
+
+
+def sm2_update(
+    easiness: np.ndarray,
+    interval: np.ndarray,
+    repetitions: np.ndarray,
+    grades: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Apply one SM-2 review to arrays of memory state.
+
+    Args:
+        easiness: Easiness factors.
+        interval: Current inter-review intervals in days.
+        repetitions: Consecutive successful reviews.
+        grades: Recall quality from 0 (blackout) to 5 (perfect).
+
+    Returns:
+        Updated ``(easiness, interval, repetitions)`` arrays.
+    """
+
+    grades = np.asarray(grades, dtype=np.float64)
+    success = grades >= 3
+    lapse = 5.0 - grades
+
+    new_easiness = np.maximum(
+        MIN_EASINESS, easiness + 0.1 - lapse * (0.08 + lapse * 0.02)
+    )
+    grown = np.rint(interval * new_easiness).astype(np.int32)
+    new_interval = np.where(
+        ~success | (repetitions == 0),
+        1,
+        np.where(repetitions == 1, 6, np.maximum(grown, 1)),
+    ).astype(np.int32)
+    new_repetitions = np.where(success, repetitions + 1, 0).astype(np.int32)
+    return new_easiness, new_interval, new_repetitions
+
+
+class ReviewBook:
+    """Columnar SM-2 memory state for (learner, module) pairs.
+
+    Learners and modules are interned to integer codes; all per-pair state lives
+    in parallel arrays that grow geometrically, so appending and bulk updates
+    stay cheap at millions of pairs.
+    """
+
+    _COLUMNS = {
+        "learner": np.int32,
+        "module": np.int32,
+        "easiness": np.float64,
+        "interval": np.int32,
+        "repetitions": np.int32,
+        "due": np.int64,
+        "last_review": np.int64,
+    }
+
+    def __init__(self) -> None:
+        self.learners: List[str] = []
+        self.modules: List[str] = []
+        self._learner_codes: Dict[str, int] = {}
+        self._module_codes: Dict[str, int] = {}
+        self._pairs: Optional[Dict[Tuple[int, int], int]] = None
+        self._size = 0
+        self._data = {
+            name: np.zeros(0, dtype=dtype) for name, dtype in self._COLUMNS.items()
+        }
+
+    def __len__(self) -> int:
+        return self._size
+
+    def column(self, name: str) -> np.ndarray:
+        """Return a view of one state column for the stored pairs."""
+
+        return self._data[name][: self._size]
+
+    def learner_codes(self, learners: Iterable[str]) -> np.ndarray:
+        """Return the codes of the given learners that have pairs in the book."""
+
+        codes = (self._learner_codes.get(learner) for learner in learners)
+        return np.asarray([code for code in codes if code is not None], dtype=np.int32)
+
+    def _intern(
+        self, values: Iterable[str], names: List[str], codes: Dict[str, int]
+    ) -> np.ndarray:
+        result = []
+        for value in values:
+            if value not in codes:
+                codes[value] = len(names)
+                names.append(value)
+            result.append(codes[value])
+        return np.asarray(result, dtype=np.int32)
+
+    def _pair_index(self) -> Dict[Tuple[int, int], int]:
+        if self._pairs is None:
+            self._pairs = {
+                (int(learner), int(module)): row
+                for row, (learner, module) in enumerate(
+                    zip(self.column("learner"), self.column("module"))
+                )
+            }
+        return self._pairs
+
+    def _reserve(self, extra: int) -> None:
+        capacity = len(self._data["learner"])
+        if self._size + extra <= capacity:
+            return
+        capacity = max(self._size + extra, capacity * 2, 64)
+        for name, values in self._data.items():
+            grown = np.zeros(capacity, dtype=values.dtype)
+            grown[: self._size] = values[: self._size]
+            self._data[name] = grown
+
+    def learn(
+        self, learners: Sequence[str], modules: Sequence[str], day: int
+    ) -> np.ndarray:
+        """Register first exposures, returning the row of every pair.
+
+        Pairs already in the book keep their state; new pairs become due the
+        next day.
+        """
+
+        learner_codes = self._intern(learners, self.learners, self._learner_codes)
+        module_codes = self._intern(modules, self.modules, self._module_codes)
+        pairs = self._pair_index()
+
+        rows = np.empty(len(learner_codes), dtype=np.int64)
+        new_rows = []
+        keys = zip(learner_codes.tolist(), module_codes.tolist())
+        for position, key in enumerate(keys):
+            if key not in pairs:
+                pairs[key] = self._size + len(new_rows)
+                new_rows.append(position)
+            rows[position] = pairs[key]
+
+        if new_rows:
+            self._reserve(len(new_rows))
+            start, end = self._size, self._size + len(new_rows)
+            self._data["learner"][start:end] = learner_codes[new_rows]
+            self._data["module"][start:end] = module_codes[new_rows]
+            self._data["easiness"][start:end] = INITIAL_EASINESS
+            self._data["interval"][start:end] = 0
+            self._data["repetitions"][start:end] = 0
+            self._data["due"][start:end] = day + 1
+            self._data["last_review"][start:end] = day
+            self._size = end
+        return rows
+
+    def record(self, rows: np.ndarray, grades: np.ndarray, day: int) -> None:
+        """Apply graded reviews taken on ``day`` to the given rows."""
+
+        rows = np.asarray(rows, dtype=np.int64)
+        easiness, interval, repetitions = sm2_update(
+            self._data["easiness"][rows],
+            self._data["interval"][rows],
+            self._data["repetitions"][rows],
+            np.broadcast_to(grades, rows.shape),
+        )
+        self._data["easiness"][rows] = easiness
+        self._data["interval"][rows] = interval
+        self._data["repetitions"][rows] = repetitions
+        self._data["due"][rows] = day + interval
+        self._data["last_review"][rows] = day
+
+    def due_queues(self, day: int, limit: int = 3) -> Tuple[np.ndarray, np.ndarray]:
+        """Pick up to ``limit`` due rows per learner, most overdue first.
+
+        Overdue-ness is measured relative to the interval, so a card one day
+        late on a one-day interval outranks one a day late on a month.
+
+        Returns:
+            ``(learner_codes, rows)`` arrays, grouped by learner.
+        """
+
+        due = self.column("due")
+        candidates = np.flatnonzero(due <= day)
+        if candidates.size == 0:
+            return np.zeros(0, dtype=np.int32), candidates
+
+        learners = self.column("learner")[candidates]
+        interval = np.maximum(self.column("interval")[candidates], 1)
+        urgency = (day - due[candidates]) / interval
+        order = np.lexsort((-urgency, learners))
+        learners, candidates = learners[order], candidates[order]
+
+        # Rank within each learner's run and keep the first ``limit``.
+        starts = np.flatnonzero(np.r_[True, learners[1:] != learners[:-1]])
+        run_start = np.repeat(starts, np.diff(np.r_[starts, learners.size]))
+        keep = np.arange(learners.size) - run_start < limit
+        return learners[keep], candidates[keep]
+
+    def save(self, path: Path) -> None:
+        """Write the book to a compressed ``.npz`` archive."""
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            path,
+            learners=np.asarray(self.learners, dtype=str),
+            modules=np.asarray(self.modules, dtype=str),
+            **{name: self.column(name) for name in self._COLUMNS},
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "ReviewBook":
+        """Read a book written by :meth:`save`."""
+
+        book = cls()
+        with np.load(path) as archive:
+            book.learners = archive["learners"].tolist()
+            book.modules = archive["modules"].tolist()
+            book._data = {
+                name: archive[name].astype(dtype) for name, dtype in cls._COLUMNS.items()
+            }
+        book._learner_codes = {name: code for code, name in enumerate(book.learners)}
+        book._module_codes = {name: code for code, name in enumerate(book.modules)}
+        book._size = len(book._data["learner"])
+        return book
+
+
+def _lesson_code(module: str) -> str:
+    """Return the lesson code at the start of a module label like "L1-2 Review"."""
+
+    return module.split(" ", 1)[0]
+
+
+def _review_day(row: Row, start_day: int) -> int:
+    """Return the book day of a row: its real date, or its nominal slot."""
+
+    if isinstance(row, DatedItem):
+        return row.date.toordinal()
+    return start_day + (row.week - 1) * 7 + parse_day_number(row.day) - 1
+
+
+def _with_module(row: Row, module: str) -> Row:
+    if isinstance(row, DatedItem):
+        return replace(row, item=replace(row.item, module=module))
+    return replace(row, module=module)
+
+
+def apply_cohort_spaced_review(
+    schedules: Mapping[str, Sequence[Row]],
+    book: Optional[ReviewBook] = None,
+    start_day: int = 0,
+    limit: int = 3,
+    expected_grade: int = 4,
+) -> Dict[str, List[Row]]:
+    """Point every learner's review slots at the earlier modules that are due.
+
+    The cohort is walked one day at a time: the day's lessons are registered in
+    ``book`` in one batch, :meth:`ReviewBook.due_queues` picks up to ``limit``
+    due modules for every learner, most overdue first, and the learners with a
+    review slot that day have their picks recorded with ``expected_grade`` in
+    one batch so later days see the planned intervals. Only the first review
+    slot of a learner's day is rewritten; slots with nothing due keep their
+    original module.
+
+    Pass dated rows from :func:`AI_scheduler.dates.materialize_cohort` whenever
+    the schedule is placed on a calendar: their ``date.toordinal()`` is used as
+    the review day, so holidays and blocked weekdays are reflected in the
+    planned intervals. Undated rows fall back to their nominal slot.
+
+    Args:
+        schedules: Rows per learner identifier, each in chronological order.
+        book: Memory state to plan against. A fresh book is used when omitted;
+            pass a persisted one to continue from the learners' real history.
+        start_day: Day number of ``Week1-Day1`` for undated rows, in the book's
+            day scale (``date.toordinal()`` to mix with dated rows).
+        limit: Maximum modules covered by one review slot.
+        expected_grade: SM-2 grade assumed for planned reviews.
+    """
+
+    book = book if book is not None else ReviewBook()
+    planned = {learner: list(items) for learner, items in schedules.items()}
+
+    # day -> (learners, lesson codes) and day -> {learner: first review slot}
+    lessons: Dict[int, Tuple[List[str], List[str]]] = {}
+    reviews: Dict[int, Dict[str, int]] = {}
+    for learner, items in planned.items():
+        for index, row in enumerate(items):
+            day = _review_day(row, start_day)
+            item = row.item if isinstance(row, DatedItem) else row
+            if item.activity in LESSON_ACTIVITIES:
+                learners, modules = lessons.setdefault(day, ([], []))
+                learners.append(learner)
+                modules.append(_lesson_code(item.module))
+            elif item.activity in REVIEW_ACTIVITIES:
+                reviews.setdefault(day, {}).setdefault(learner, index)
+
+    for day in sorted(lessons.keys() | reviews.keys()):
+        if day in lessons:
+            book.learn(*lessons[day], day)
+        slots = reviews.get(day)
+        if not slots:
+            continue
+
+        queue_learners, rows = book.due_queues(day, limit)
+        keep = np.isin(queue_learners, book.learner_codes(slots))
+        queue_learners, rows = queue_learners[keep], rows[keep]
+        if rows.size == 0:
+            continue
+        book.record(rows, np.full(rows.size, expected_grade), day)
+
+        module_codes = book.column("module")[rows]
+        starts = np.flatnonzero(np.r_[True, queue_learners[1:] != queue_learners[:-1]])
+        for first, last in zip(starts, np.r_[starts[1:], rows.size]):
+            learner = book.learners[queue_learners[first]]
+            modules = [book.modules[code] for code in module_codes[first:last]]
+            index = slots[learner]
+            planned[learner][index] = _with_module(
+                planned[learner][index], f"{', '.join(modules)} Review"
+            )
+    return planned
+
+
+def apply_spaced_review(
+    items: Iterable[Row],
+    book: Optional[ReviewBook] = None,
+    learner: str = "",
+    start_day: int = 0,
+    limit: int = 3,
+    expected_grade: int = 4,
+) -> List[Row]:
+    """Point one learner's review slots at the earlier modules that are due.
+
+    A single-learner form of :func:`apply_cohort_spaced_review`; ``learner`` is
+    the learner's identifier in ``book``.
+    """
+
+    planned = apply_cohort_spaced_review(
+        {learner: list(items)}, book, start_day, limit, expected_grade
+    )
+    return planned[learner]
+
+
+__all__ = [
+    "REVIEW_ACTIVITIES",
+    "ReviewBook",
+    "apply_cohort_spaced_review",
+    "apply_spaced_review",
+    "sm2_update",
+]
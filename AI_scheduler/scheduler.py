@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from typing import Iterable, List
 
+from .pacing import WEEKLY_ACTIVITIES, optimize_weekly_minutes
+
 
 @dataclass(frozen=True)
 class ScheduledItem:
@@ -15,9 +17,16 @@ class ScheduledItem:
     goal: str
 
     def to_row(self) -> dict:
-        """Return a dict representation for export or JSON serialization."""
+        """Return a dict representation for export or JSON serialization.
+
+        For bulk exports prefer :mod:`AI_scheduler.bulk`, which skips the
+        per-row dict entirely.
+        """
+
+        return {name: getattr(self, name) for name in ROW_FIELDS}
 
-        return asdict(self)
+
+ROW_FIELDS = tuple(field.name for field in fields(ScheduledItem))
 
 
 def _level_block(level: int, start_week: int, start_lesson: int) -> List[ScheduledItem]:
@@ -93,16 +102,26 @@ def build_ai_schedule(
     available_minutes_per_week: int = 180,
     focus_area: str = "balanced",
     weeks: int = 6,
+    pacing: str = "optimized",
 ) -> List[ScheduledItem]:
     """Create a lightly personalized schedule tuned by simple AI-inspired heuristics.
 
     The generator adjusts daily durations based on available minutes per week and
     annotates goals with the requested focus area. It keeps the same tabular shape
     as the mockup schedule so it can be exported the same way.
+
+    With ``pacing="optimized"`` the weekly minutes are split across activities by
+    :func:`AI_scheduler.pacing.optimize_weekly_minutes`, which never exceeds the
+    weekly budget, always keeps the lesson and skips other activities that do
+    not fit. Activities given more than one session's maximum are split into
+    ``(part n)`` items on the same day. ``pacing="heuristic"`` keeps the
+    original clamped ``daily_minutes`` rule.
     """
 
     if available_minutes_per_week <= 0:
         raise ValueError("available_minutes_per_week must be greater than zero")
+    if pacing not in ("optimized", "heuristic"):
+        raise ValueError("pacing must be 'optimized' or 'heuristic'")
 
     focus_goals = {
         "conversation": "Prioritize voice input and conversation practice to automate speaking output",
@@ -112,53 +131,59 @@ def build_ai_schedule(
     }
     goal = focus_goals.get(focus_area, focus_goals["balanced"])
 
-    # Give learners at least 20 minutes/day, cap at 90 minutes to keep sessions short.
-    daily_minutes = min(90, max(20, available_minutes_per_week // 5))
-
+    if pacing == "optimized":
+        allocation = optimize_weekly_minutes(available_minutes_per_week, focus_area)
+        pace = f"{sum(allocation.values())} min/week"
+    else:
+        # Give learners at least 20 minutes/day, cap at 90 minutes to keep sessions short.
+        daily_minutes = min(90, max(20, available_minutes_per_week // 5))
+        allocation = {
+            "On-demand lesson": daily_minutes,
+            "Quiz": max(20, daily_minutes - 10),
+            "AI review / refresh": min(30, daily_minutes),
+            "Focus practice": daily_minutes,
+            "Integrated check": min(60, daily_minutes + 10),
+        }
+        pace = f"{daily_minutes} min/day"
+
+    specs = {spec.name: spec for spec in WEEKLY_ACTIVITIES}
     schedule: List[ScheduledItem] = []
     lesson_number = 1
 
     for week in range(1, weeks + 1):
         level = 1 + (week - 1) // 2
-        week_goal = f"{goal} (AI suggested pace: {daily_minutes} min/day)"
+        week_goal = f"{goal} (AI suggested pace: {pace})"
 
         # Five-day cadence that rotates learning, assessment, AI review, and practice.
         activities = [
-            ("On-demand lesson", daily_minutes, f"L{level}-{lesson_number}"),
-            (
-                "Quiz",
-                max(20, daily_minutes - 10),
-                f"L{level}-{lesson_number} Check quiz",
-            ),
-            (
-                "AI review / refresh",
-                min(30, daily_minutes),
-                f"L{level}-{lesson_number} Review notes",
-            ),
+            ("On-demand lesson", f"L{level}-{lesson_number}"),
+            ("Quiz", f"L{level}-{lesson_number} Check quiz"),
+            ("AI review / refresh", f"L{level}-{lesson_number} Review notes"),
             (
                 "Focus practice",
-                daily_minutes,
                 f"{focus_area.capitalize()} practice L{level}-{lesson_number}",
             ),
-            (
-                "Integrated check",
-                min(60, daily_minutes + 10),
-                f"L{level}-{lesson_number} Integrated exercise",
-            ),
+            ("Integrated check", f"L{level}-{lesson_number} Integrated exercise"),
         ]
 
-        for day_index, (activity, minutes, module) in enumerate(activities, start=1):
-            schedule.append(
-                ScheduledItem(
-                    level=level,
-                    week=week,
-                    day=f"Week{week}-Day{day_index}",
-                    activity=activity,
-                    module=module,
-                    duration_minutes=minutes,
-                    goal=week_goal,
+        for day_index, (activity, module) in enumerate(activities, start=1):
+            minutes = allocation[activity]
+            if not minutes:
+                continue
+            sessions = specs[activity].sessions(minutes)
+            for part, session_minutes in enumerate(sessions, start=1):
+                label = module if len(sessions) == 1 else f"{module} (part {part})"
+                schedule.append(
+                    ScheduledItem(
+                        level=level,
+                        week=week,
+                        day=f"Week{week}-Day{day_index}",
+                        activity=activity,
+                        module=label,
+                        duration_minutes=session_minutes,
+                        goal=week_goal,
+                    )
                 )
-            )
 
         lesson_number += 1
 
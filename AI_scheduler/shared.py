@@ -0,0 +1,157 @@
+"""Read-only, memory-mapped cohort datasets shared across app sessions.
+
+A cohort schedule is written once as a directory of ``.npy`` columns plus a
+small ``meta.json`` holding the string dictionaries. Readers open the columns
+with ``mmap_mode="r"``, so every Streamlit session (and every server process)
+maps the same pages from the OS page cache instead of holding its own copy.
+Rows are sorted by learner and indexed by offsets, so a learner's rows are a
+zero-copy slice of each column.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Mapping, Sequence
+
+import numpy as np
+
+from .dates import DatedItem, parse_day_number
+from .fingerprint import cohort_fingerprints, save_fingerprints
+
+FORMAT_VERSION = 1
+
+# Dictionary-encoded string columns; the rest are stored as plain numbers.
+STRING_COLUMNS = ("activity", "module", "goal", "day")
+NUMERIC_COLUMNS = {
+    "level": np.int16,
+    "week": np.int16,
+    "day_number": np.int8,
+    "duration_minutes": np.int32,
+    "start": "datetime64[m]",
+    "end": "datetime64[m]",
+}
+
+
+def write_cohort_dataset(
+    schedules: Mapping[str, Sequence[DatedItem]], directory: Path
+) -> None:
+    """Write materialized cohort schedules as a memory-mappable dataset.
+
+    Fingerprints are written to a ``fingerprints/`` subdirectory so regenerated
+    cohorts can be compared with ``cohort_diff.py``.
+
+    Args:
+        schedules: Dated rows per learner, e.g. from
+            :func:`AI_scheduler.dates.materialize_cohort`.
+        directory: Output directory; existing column files are replaced. Write
+            regenerated cohorts to a fresh directory rather than over one that
+            running apps have mapped.
+    """
+
+    directory.mkdir(parents=True, exist_ok=True)
+    learners = sorted(schedules)
+    counts = [len(schedules[learner]) for learner in learners]
+    rows: List[DatedItem] = [row for learner in learners for row in schedules[learner]]
+
+    dictionaries: Dict[str, List[str]] = {}
+    for column in STRING_COLUMNS:
+        index: Dict[str, int] = {}
+        codes = np.fromiter(
+            (index.setdefault(getattr(row.item, column), len(index)) for row in rows),
+            dtype=np.int32,
+            count=len(rows),
+        )
+        dictionaries[column] = list(index)
+        np.save(directory / f"{column}.npy", codes)
+
+    columns = {
+        "level": [row.item.level for row in rows],
+        "week": [row.item.week for row in rows],
+        "day_number": [parse_day_number(row.item.day) for row in rows],
+        "duration_minutes": [row.item.duration_minutes for row in rows],
+        "start": [row.start for row in rows],
+        "end": [row.end for row in rows],
+    }
+    for column, dtype in NUMERIC_COLUMNS.items():
+        np.save(directory / f"{column}.npy", np.asarray(columns[column], dtype=dtype))
+
+    offsets = np.concatenate(([0], np.cumsum(counts, dtype=np.int64)))
+    np.save(directory / "offsets.npy", offsets)
+
+    meta = {
+        "version": FORMAT_VERSION,
+        "rows": len(rows),
+        "learners": learners,
+        "dictionaries": dictionaries,
+    }
+    (directory / "meta.json").write_text(json.dumps(meta), encoding="utf-8")
+    save_fingerprints(cohort_fingerprints(schedules), directory / "fingerprints")
+
+
+@dataclass(frozen=True)
+class CohortView:
+    """Zero-copy column views for a contiguous range of dataset rows."""
+
+    columns: Mapping[str, np.ndarray]
+    dictionaries: Mapping[str, Sequence[str]]
+
+    def __len__(self) -> int:
+        return len(self.columns["level"])
+
+    def decode(self, column: str) -> np.ndarray:
+        """Return the string values of a dictionary-encoded column."""
+
+        categories = np.asarray(self.dictionaries[column], dtype=object)
+        return categories[self.columns[column]]
+
+
+class CohortDataset:
+    """A memory-mapped cohort dataset opened read-only.
+
+    Opening is cheap and all column arrays are shared mappings, so a long-lived
+    instance can be handed to every session, e.g. via ``st.cache_resource``.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        meta = json.loads((directory / "meta.json").read_text(encoding="utf-8"))
+        if meta.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported cohort dataset version: {meta.get('version')}")
+
+        self.directory = directory
+        self.learners: List[str] = meta["learners"]
+        self.dictionaries: Dict[str, List[str]] = meta["dictionaries"]
+        self._learner_index = {learner: index for index, learner in enumerate(self.learners)}
+        self._offsets = np.load(directory / "offsets.npy")
+        self._columns = {
+            column: np.load(directory / f"{column}.npy", mmap_mode="r")
+            for column in (*STRING_COLUMNS, *NUMERIC_COLUMNS)
+        }
+
+    def __len__(self) -> int:
+        return int(self._offsets[-1])
+
+    def learner(self, learner: str) -> CohortView:
+        """Return the rows of one learner as zero-copy slices."""
+
+        if learner not in self._learner_index:
+            raise KeyError(learner)
+        index = self._learner_index[learner]
+        start, end = int(self._offsets[index]), int(self._offsets[index + 1])
+        return CohortView(
+            {column: values[start:end] for column, values in self._columns.items()},
+            self.dictionaries,
+        )
+
+    def all(self) -> CohortView:
+        """Return the whole dataset as read-only column views."""
+
+        return CohortView(dict(self._columns), self.dictionaries)
+
+
+__all__ = [
+    "CohortDataset",
+    "CohortView",
+    "write_cohort_dataset",
+]
@@ -2,38 +2,41 @@
 
 from __future__ import annotations
 
+import os
 from datetime import date, datetime, time, timedelta
+from pathlib import Path
 from typing import Iterable
 
+import numpy as np
+
 import pandas as pd
 import plotly.express as px
 import streamlit as st
 
-from AI_scheduler import ScheduledItem, build_ai_schedule, build_schedule
+from AI_scheduler import (
+    Availability,
+    DatedItem,
+    apply_spaced_review,
+    build_ai_schedule,
+    build_schedule,
+    materialize_dates,
+)
+from AI_scheduler.dates import WEEKDAY_NAMES, parse_day_number
+from AI_scheduler.shared import CohortDataset, CohortView
 
 st.set_page_config(page_title="AI Scheduler Calendar", layout="wide")
 
 
-def _parse_day_number(day_label: str) -> int:
-    """Extract the numeric portion from a day label like "Week1-Day3"."""
-
-    for part in day_label.split("-"):
-        if part.startswith("Day"):
-            number = part.replace("Day", "")
-            if number.isdigit():
-                return int(number)
-    return 1
-
-
-def _to_dataframe(items: Iterable[ScheduledItem], start: date) -> pd.DataFrame:
-    """Convert scheduled items to a tabular DataFrame with calendar metadata."""
+def _to_dataframe(dated_items: Iterable[DatedItem]) -> pd.DataFrame:
+    """Convert dated schedule items to a tabular DataFrame with calendar metadata."""
 
     rows = []
-    for item in items:
-        day_number = _parse_day_number(item.day)
-        event_date = start + timedelta(days=(item.week - 1) * 7 + day_number - 1)
-        start_at = datetime.combine(event_date, time(hour=9))
-        end_at = start_at + timedelta(minutes=item.duration_minutes)
+    for dated in dated_items:
+        item = dated.item
+        day_number = parse_day_number(item.day)
+        event_date = dated.date
+        start_at = dated.start
+        end_at = dated.end
         full_day_start = datetime.combine(event_date, time.min)
         full_day_end = full_day_start + timedelta(days=1)
 
@@ -58,6 +61,37 @@ def _to_dataframe(items: Iterable[ScheduledItem], start: date) -> pd.DataFrame:
     return pd.DataFrame(rows)
 
 
+@st.cache_resource
+def _shared_cohort(directory: str) -> CohortDataset:
+    """Open the cohort dataset once per server process for all sessions."""
+
+    return CohortDataset(Path(directory))
+
+
+def _cohort_dataframe(view: CohortView) -> pd.DataFrame:
+    """Build the calendar DataFrame for a slice of the shared cohort dataset."""
+
+    start = pd.to_datetime(view.columns["start"])
+    full_day_start = start.normalize()
+    return pd.DataFrame(
+        {
+            "Level": view.columns["level"],
+            "Week": [f"Week {week}" for week in view.columns["week"]],
+            "Day": view.decode("day"),
+            "Date": full_day_start.date,
+            "Activity": view.decode("activity"),
+            "Module": view.decode("module"),
+            "Duration (min)": view.columns["duration_minutes"],
+            "Goal": view.decode("goal"),
+            "Start": start,
+            "End": pd.to_datetime(view.columns["end"]),
+            "Full-day start": full_day_start,
+            "Full-day end": full_day_start + pd.Timedelta(days=1),
+            "Day number": np.asarray(view.columns["day_number"]),
+        }
+    )
+
+
 def _render_calendar(df: pd.DataFrame) -> None:
     """Render a Plotly timeline that acts as a calendar visualization."""
 
@@ -127,7 +161,7 @@ def _render_month_view(df: pd.DataFrame) -> None:
 def _render_table(df: pd.DataFrame) -> None:
     """Render the tabular representation of the schedule."""
 
-    display = df.sort_values(["Date", "Day number"])[
+    display = df.sort_values(["Start", "Day number"])[
         ["Date", "Week", "Day", "Activity", "Module", "Duration (min)", "Goal"]
     ]
     st.dataframe(display, use_container_width=True, hide_index=True)
@@ -143,13 +177,24 @@ def main() -> None:
     with st.sidebar:
         st.header("Controls")
         start_date = st.date_input("Schedule start date", value=date.today())
+        cohort_directory = os.environ.get("AI_SCHEDULER_COHORT")
+        modes = ["Fixed mockup", "AI-personalized"]
+        if cohort_directory:
+            modes.append("Shared cohort")
         schedule_type = st.radio(
             "Schedule mode",
-            ["Fixed mockup", "AI-personalized"],
+            modes,
             help="Select the classic mockup or the adaptive AI-driven schedule.",
         )
 
-        if schedule_type == "AI-personalized":
+        if schedule_type == "Shared cohort":
+            cohort = _shared_cohort(cohort_directory)
+            learner = st.selectbox("Learner", cohort.learners)
+            st.caption(
+                f"Pre-generated cohort of {len(cohort.learners)} learners shared by "
+                "all sessions."
+            )
+        elif schedule_type == "AI-personalized":
             weekly_minutes = st.slider(
                 "Minutes per week", min_value=60, max_value=600, value=180, step=10
             )
@@ -159,11 +204,21 @@ def main() -> None:
                 ["balanced", "conversation", "reading", "exam"],
                 help="Influences the goals and practice modules for each week.",
             )
+            pacing = st.radio(
+                "Pacing",
+                ["optimized", "heuristic"],
+                horizontal=True,
+                help=(
+                    "Optimized splits the weekly minutes across activities without "
+                    "exceeding the budget; heuristic uses one clamped daily length."
+                ),
+            )
 
             schedule = build_ai_schedule(
                 available_minutes_per_week=weekly_minutes,
                 focus_area=focus,
                 weeks=weeks,
+                pacing=pacing,
             )
             st.caption(
                 "AI-personalized pacing with adjustable weekly minutes and focus area."
@@ -173,7 +228,44 @@ def main() -> None:
             start_date = start_date  # keep explicit for clarity
             st.caption("Two-month mockup schedule across Levels 1–3.")
 
-    df = _to_dataframe(schedule, start_date)
+        if schedule_type != "Shared cohort":
+            spaced_review = st.checkbox(
+                "Spaced review",
+                help=(
+                    "Review days cover earlier modules that are due instead of the "
+                    "current lesson."
+                ),
+            )
+
+            study_days = st.multiselect(
+                "Study days",
+                list(WEEKDAY_NAMES),
+                default=list(WEEKDAY_NAMES),
+                help="Schedule days are placed on these weekdays in turn.",
+            )
+            holiday_text = st.text_area(
+                "Holidays",
+                help="One ISO date (YYYY-MM-DD) per line. Holidays are skipped.",
+            )
+
+    if schedule_type == "Shared cohort":
+        df = _cohort_dataframe(cohort.learner(learner))
+    else:
+        try:
+            holidays = [
+                date.fromisoformat(line.strip())
+                for line in holiday_text.splitlines()
+                if line.strip()
+            ]
+            availability = Availability.from_weekdays(study_days)
+            dated = materialize_dates(schedule, start_date, availability, holidays)
+            if spaced_review:
+                # Plan review intervals on the dates the sessions actually fall on.
+                dated = apply_spaced_review(dated)
+            df = _to_dataframe(dated)
+        except ValueError as exc:
+            st.error(f"Could not place the schedule on the calendar: {exc}")
+            return
 
     st.subheader("Calendar")
     calendar_mode = st.radio(
@@ -0,0 +1,50 @@
+"""Compare two cohort fingerprint directories and list the learners who changed.
+
+Fingerprints are written next to generated output by ``main.py --fingerprints``
+or :func:`AI_scheduler.write_cohort_dataset`. Learners are compared by schedule
+digest from the two indexes first, and only changed learners have their row
+files read and diffed, so the output is a compact JSON Lines change list for
+downstream re-exports and notifications.
+
+    python cohort_diff.py old/fingerprints new/fingerprints
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from AI_scheduler.fingerprint import FingerprintStore, diff_cohorts
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Diff two cohort fingerprint sets")
+    parser.add_argument("old", type=Path, help="Fingerprints of the previous run")
+    parser.add_argument("new", type=Path, help="Fingerprints of the regenerated run")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Optional path to save the change list as JSON Lines (default: stdout)",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    changes = diff_cohorts(FingerprintStore(args.old), FingerprintStore(args.new))
+
+    stream = args.output.open("w", encoding="utf-8") if args.output else sys.stdout
+    count = 0
+    try:
+        for change in changes:
+            stream.write(json.dumps(change, separators=(",", ":")) + "\n")
+            count += 1
+    finally:
+        if args.output:
+            stream.close()
+
+    print(f"{count} learner(s) changed", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
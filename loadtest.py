@@ -0,0 +1,296 @@
+"""Headless rerun-latency load test for the Streamlit calendar app.
+
+Each simulated session drives ``app.py`` through Streamlit's ``AppTest`` with a
+scripted sequence of widget interactions (mode switches, slider sweeps,
+calendar-style toggles and the shared-cohort view) and times every rerun. A
+small sample cohort dataset is generated so the "Shared cohort" mode is
+exercised too. A second pass measures how much memory each live session
+retains. The script exits non-zero when a result is over its budget or the app
+raised, so it can gate CI or a deploy.
+
+    python loadtest.py --sessions 20 --concurrency 4 --p95-budget-ms 800
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+from AI_scheduler import build_ai_schedule, materialize_cohort, write_cohort_dataset
+
+APP_PATH = Path(__file__).with_name("app.py")
+COHORT_ENV = "AI_SCHEDULER_COHORT"
+SAMPLE_LEARNERS = 200
+
+# (widget type, label, value) steps replayed by every session after the first run.
+Step = Tuple[str, str, Any]
+
+SCENARIO: List[Step] = [
+    ("radio", "Schedule mode", "AI-personalized"),
+    *[("slider", "Minutes per week", minutes) for minutes in range(60, 601, 90)],
+    *[("slider", "Number of weeks", weeks) for weeks in (2, 6, 12)],
+    ("selectbox", "Focus area", "conversation"),
+    ("radio", "Pacing", "heuristic"),
+    ("radio", "Calendar style", "Month-style blocks"),
+    ("radio", "Calendar style", "Daily timeline"),
+    ("checkbox", "Spaced review", True),
+    ("radio", "Schedule mode", "Shared cohort"),
+    *[("selectbox", "Learner", f"learner-{index:03d}") for index in (7, 42, 199)],
+    ("radio", "Calendar style", "Daily timeline"),
+    ("radio", "Schedule mode", "Fixed mockup"),
+    ("radio", "Calendar style", "Month-style blocks"),
+]
+
+
+@dataclass
+class LoadTestResult:
+    sessions: int
+    reruns: int
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+    memory_per_session_mb: float
+    failures: List[str]
+
+
+def _widget(app: AppTest, kind: str, label: str):
+    for widget in app.get(kind):
+        if widget.label == label:
+            return widget
+    raise LookupError(f"No {kind} labelled {label!r} on the current page")
+
+
+def _apply(app: AppTest, step: Step) -> None:
+    kind, label, value = step
+    widget = _widget(app, kind, label)
+    if kind == "checkbox" and value:
+        widget.check()
+    elif kind == "checkbox":
+        widget.uncheck()
+    else:
+        widget.set_value(value)
+
+
+def write_sample_cohort(directory: Path, learners: int = SAMPLE_LEARNERS) -> None:
+    """Write a cohort dataset of varied AI-personalized plans for the scenario."""
+
+    focus_areas = ("balanced", "conversation", "reading", "exam")
+    schedules = {
+        f"learner-{index:03d}": build_ai_schedule(
+            available_minutes_per_week=60 + 10 * (index % 25),
+            focus_area=focus_areas[index % len(focus_areas)],
+        )
+        for index in range(learners)
+    }
+    write_cohort_dataset(materialize_cohort(schedules, date(2026, 1, 5)), directory)
+
+
+def _describe(step: Optional[Step]) -> str:
+    return "on the first run" if step is None else f"after {step}"
+
+
+def _run_session(
+    scenario: Sequence[Step], timeout: float
+) -> Tuple[List[float], AppTest, Optional[str]]:
+    """Replay ``scenario`` in a fresh session.
+
+    Returns:
+        Rerun latencies in ms, the session, and a failure message if the app
+        raised or a step could not be applied. The session stops at the first
+        failure.
+    """
+
+    app = AppTest.from_file(str(APP_PATH), default_timeout=timeout)
+    latencies: List[float] = []
+
+    for step in (None, *scenario):
+        try:
+            if step is not None:
+                _apply(app, step)
+            started = time.perf_counter()
+            app.run()
+        except Exception as exc:
+            # Missing widgets and timeouts are reported like app exceptions.
+            return latencies, app, f"{_describe(step)} failed: {exc}"
+        latencies.append((time.perf_counter() - started) * 1000)
+        if app.exception:
+            message = app.exception[0].message
+            return latencies, app, f"app raised {_describe(step)}: {message}"
+    return latencies, app, None
+
+
+def measure_latency(
+    sessions: int, concurrency: int, scenario: Sequence[Step], timeout: float
+) -> Tuple[np.ndarray, List[str]]:
+    """Run ``sessions`` sessions, ``concurrency`` at a time.
+
+    Returns:
+        All rerun latencies and one failure message per failed session.
+    """
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(
+            pool.map(lambda _: _run_session(scenario, timeout), range(sessions))
+        )
+    latencies = np.array([latency for run in results for latency in run[0]])
+    return latencies, [run[2] for run in results if run[2] is not None]
+
+
+def measure_memory(
+    sessions: int, scenario: Sequence[Step], timeout: float
+) -> Tuple[float, List[str]]:
+    """Return the average memory in MB retained by each live session.
+
+    Sessions are kept alive until all have run so their state, element trees
+    and DataFrames are counted. Module imports and caches are warmed first so
+    they do not count against the first session. Failure messages of the
+    measured sessions are returned alongside.
+    """
+
+    _run_session(scenario, timeout)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        runs = [_run_session(scenario, timeout) for _ in range(sessions)]
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+    failures = [run[2] for run in runs if run[2] is not None]
+    del runs
+    return retained / sessions / (1024 * 1024), failures
+
+
+def run_load_test(
+    sessions: int = 10,
+    concurrency: int = 1,
+    memory_sessions: int = 3,
+    p50_budget_ms: float = float("inf"),
+    p95_budget_ms: float = float("inf"),
+    memory_budget_mb: float = float("inf"),
+    scenario: Sequence[Step] = SCENARIO,
+    timeout: float = 30.0,
+) -> LoadTestResult:
+    """Measure rerun latency and per-session memory against the given budgets.
+
+    A sample cohort dataset is written to a temporary directory and exposed to
+    the app through ``AI_SCHEDULER_COHORT`` for the duration of the run.
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        write_sample_cohort(Path(directory))
+        previous = os.environ.get(COHORT_ENV)
+        os.environ[COHORT_ENV] = directory
+        try:
+            latencies, failures = measure_latency(
+                sessions, concurrency, scenario, timeout
+            )
+            memory = 0.0
+            if memory_sessions:
+                memory, memory_failures = measure_memory(
+                    memory_sessions, scenario, timeout
+                )
+                failures.extend(memory_failures)
+        finally:
+            if previous is None:
+                os.environ.pop(COHORT_ENV, None)
+            else:
+                os.environ[COHORT_ENV] = previous
+
+    p50, p95 = np.percentile(latencies, [50, 95]) if latencies.size else (0.0, 0.0)
+    if p50 > p50_budget_ms:
+        failures.append(f"p50 {p50:.0f} ms exceeds budget {p50_budget_ms:.0f} ms")
+    if p95 > p95_budget_ms:
+        failures.append(f"p95 {p95:.0f} ms exceeds budget {p95_budget_ms:.0f} ms")
+    if memory > memory_budget_mb:
+        failures.append(
+            f"memory {memory:.1f} MB/session exceeds budget {memory_budget_mb:.1f} MB"
+        )
+
+    return LoadTestResult(
+        sessions=sessions,
+        reruns=len(latencies),
+        p50_ms=round(float(p50), 1),
+        p95_ms=round(float(p95), 1),
+        max_ms=round(float(latencies.max()), 1) if latencies.size else 0.0,
+        memory_per_session_mb=round(memory, 2),
+        failures=failures,
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load test app.py rerun latency")
+    parser.add_argument("--sessions", type=int, default=10, help="Simulated sessions")
+    parser.add_argument(
+        "--concurrency", type=int, default=1, help="Sessions running at the same time"
+    )
+    parser.add_argument(
+        "--memory-sessions",
+        type=int,
+        default=3,
+        help="Live sessions kept for the memory pass (0 to skip it)",
+    )
+    parser.add_argument(
+        "--p50-budget-ms", type=float, default=float("inf"), help="Fail above this p50"
+    )
+    parser.add_argument(
+        "--p95-budget-ms", type=float, default=float("inf"), help="Fail above this p95"
+    )
+    parser.add_argument(
+        "--memory-budget-mb",
+        type=float,
+        default=float("inf"),
+        help="Fail above this retained memory per session",
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=30.0, help="Seconds allowed for one rerun"
+    )
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    result = run_load_test(
+        sessions=args.sessions,
+        concurrency=args.concurrency,
+        memory_sessions=args.memory_sessions,
+        p50_budget_ms=args.p50_budget_ms,
+        p95_budget_ms=args.p95_budget_ms,
+        memory_budget_mb=args.memory_budget_mb,
+        timeout=args.timeout,
+    )
+
+    if args.json:
+        print(json.dumps(asdict(result), indent=2))
+    else:
+        print(f"Sessions: {result.sessions} ({result.reruns} reruns)")
+        print(
+            f"Rerun latency: p50 {result.p50_ms} ms, p95 {result.p95_ms} ms, "
+            f"max {result.max_ms} ms"
+        )
+        print(f"Memory per session: {result.memory_per_session_mb} MB")
+        for failure in result.failures:
+            print(f"FAIL: {failure}")
+
+    if result.failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
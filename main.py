@@ -1,15 +1,47 @@
 """Entry point for the AI scheduler mockup."""
 
 import argparse
+import json
+import sys
+from datetime import date
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 from AI_scheduler import (
+    Availability,
+    Curriculum,
+    LearnerPlan,
+    ReviewBook,
     ScheduledItem,
+    apply_cohort_spaced_review,
+    apply_spaced_review,
     build_ai_schedule,
+    build_curriculum_schedule,
     build_schedule,
+    load_curriculum,
+    load_holidays,
+    materialize_cohort,
+    materialize_dates,
+    render_dated_schedule,
     render_schedule,
 )
+from AI_scheduler.bulk import export_schedule_to_csv, export_schedule_to_jsonl
 from AI_scheduler.excel import export_schedule_to_excel
+from AI_scheduler.fingerprint import schedule_fingerprints, update_fingerprints
+from AI_scheduler.ics import export_schedule_to_ics
+from AI_scheduler.shared import write_cohort_dataset
+
+
+def parse_weekdays(value: str) -> Availability:
+    """Parse ``--weekdays`` into an availability, rejecting empty or unknown names."""
+
+    names = [name for name in value.split(",") if name.strip()]
+    if not names:
+        raise argparse.ArgumentTypeError("expected at least one weekday, e.g. Mon,Wed")
+    try:
+        return Availability.from_weekdays(names)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
 
 
 def parse_args() -> argparse.Namespace:
@@ -17,7 +49,13 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--output",
         type=Path,
-        help="Optional path to save the generated table as Markdown",
+        help="Optional path to save the generated schedule (default: stdout)",
+    )
+    parser.add_argument(
+        "--format",
+        default="markdown",
+        choices=["markdown", "jsonl", "csv"],
+        help="Format for --output or stdout (default: markdown)",
     )
     parser.add_argument(
         "--excel",
@@ -40,33 +78,251 @@ def parse_args() -> argparse.Namespace:
         default="balanced",
         help="Focus area for the AI generator (balanced, conversation, reading, exam)",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--pacing",
+        default="optimized",
+        choices=["optimized", "heuristic"],
+        help="How the AI generator splits weekly minutes across activities",
+    )
+    parser.add_argument(
+        "--curriculum",
+        type=Path,
+        help="JSON list of modules with prerequisites to schedule instead of the mockup",
+    )
+    parser.add_argument(
+        "--priority",
+        default="weight",
+        choices=["weight", "focus", "critical-path"],
+        help="Ordering among ready curriculum modules (default: weight)",
+    )
+    parser.add_argument(
+        "--spaced-review",
+        action="store_true",
+        help="Let review days cover earlier modules that are due (SM-2 spacing)",
+    )
+    parser.add_argument(
+        "--review-state",
+        type=Path,
+        help="Optional .npz review history (ReviewBook.save) to plan --spaced-review from",
+    )
+    parser.add_argument(
+        "--start-date",
+        type=date.fromisoformat,
+        help="Place the schedule on real dates starting from this ISO date",
+    )
+    parser.add_argument(
+        "--holidays",
+        type=Path,
+        help="File with one ISO holiday date per line to skip when --start-date is set",
+    )
+    parser.add_argument(
+        "--weekdays",
+        type=parse_weekdays,
+        default="Mon,Tue,Wed,Thu,Fri,Sat,Sun",
+        help="Comma-separated weekdays available for study (default: every day)",
+    )
+    parser.add_argument(
+        "--ics",
+        type=Path,
+        help="Optional path to save the schedule as an iCalendar (.ics) file",
+    )
+    parser.add_argument(
+        "--ics-manifest",
+        type=Path,
+        help="JSON manifest of published events used to bump SEQUENCE on changes",
+    )
+    parser.add_argument(
+        "--ics-changes-only",
+        action="store_true",
+        help="Only write new, changed and cancelled events (requires --ics-manifest)",
+    )
+    parser.add_argument(
+        "--cohort-dataset",
+        type=Path,
+        help="Directory to write a memory-mapped dataset the Streamlit app can share",
+    )
+    parser.add_argument(
+        "--cohort-plans",
+        type=Path,
+        help="JSON object of learner plans to write to --cohort-dataset as one cohort",
+    )
+    parser.add_argument(
+        "--fingerprints",
+        type=Path,
+        help="Add the learner's schedule and row fingerprints to this directory",
+    )
+    parser.add_argument(
+        "--learner",
+        default="",
+        help="Learner identifier used to derive stable calendar event UIDs",
+    )
+    args = parser.parse_args()
+    if args.ics_changes_only and not args.ics_manifest:
+        parser.error("--ics-changes-only requires --ics-manifest")
+    if args.ics_manifest and not args.start_date:
+        # Undated events are anchored on --start-date; today would drift DTSTART.
+        parser.error("--ics-manifest requires --start-date")
+    if args.cohort_dataset and not args.start_date:
+        parser.error("--cohort-dataset requires --start-date")
+    if args.cohort_plans and not args.cohort_dataset:
+        parser.error("--cohort-plans requires --cohort-dataset")
+    return args
 
 
-def main() -> None:
-    args = parse_args()
+def build_learner_schedule(
+    args: argparse.Namespace,
+    curriculum: Optional[Curriculum],
+    minutes_per_week: int,
+    focus: str,
+) -> List[ScheduledItem]:
+    """Build one learner's undated schedule with the generator chosen on the CLI."""
+
+    if curriculum is not None:
+        plan = LearnerPlan(
+            minutes_per_week=minutes_per_week, focus=focus, priority=args.priority
+        )
+        return build_curriculum_schedule(curriculum, plan).items
     if args.ai_personalized:
-        schedule = build_ai_schedule(
-            available_minutes_per_week=args.minutes_per_week,
-            focus_area=args.focus,
+        return build_ai_schedule(
+            available_minutes_per_week=minutes_per_week,
+            focus_area=focus,
+            pacing=args.pacing,
         )
+    return build_schedule()
+
+
+def load_review_book(args: argparse.Namespace) -> ReviewBook:
+    """Open ``--review-state`` when it exists, otherwise start an empty book."""
+
+    if args.review_state and args.review_state.exists():
+        return ReviewBook.load(args.review_state)
+    return ReviewBook()
+
+
+def load_cohort_plans(
+    path: Path, args: argparse.Namespace
+) -> Dict[str, Tuple[int, str, Availability]]:
+    """Read ``{learner: {"minutes_per_week", "focus", "weekdays"}}`` plans.
+
+    Every key is optional and defaults to the matching CLI option.
+    """
+
+    plans = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(plans, dict):
+        raise ValueError("Cohort plans must be a JSON object keyed by learner")
+
+    cohort = {}
+    for learner, plan in plans.items():
+        unknown = set(plan) - {"minutes_per_week", "focus", "weekdays"}
+        if unknown:
+            names = ", ".join(sorted(unknown))
+            raise ValueError(f"Unknown plan keys for {learner}: {names}")
+        weekdays = plan.get("weekdays")
+        cohort[learner] = (
+            int(plan.get("minutes_per_week", args.minutes_per_week)),
+            plan.get("focus", args.focus),
+            Availability.from_weekdays(weekdays) if weekdays else args.weekdays,
+        )
+    return cohort
+
+
+def write_cohort(
+    args: argparse.Namespace,
+    curriculum: Optional[Curriculum],
+    holidays: Tuple[date, ...],
+) -> None:
+    """Schedule every learner in ``--cohort-plans`` and write the shared dataset."""
+
+    plans = load_cohort_plans(args.cohort_plans, args)
+    built: Dict[Tuple[int, str], List[ScheduledItem]] = {}
+    schedules = {}
+    for learner, (minutes_per_week, focus, _) in plans.items():
+        key = (minutes_per_week, focus)
+        if key not in built:
+            built[key] = build_learner_schedule(
+                args, curriculum, minutes_per_week, focus
+            )
+        schedules[learner] = built[key]
+
+    availability = {learner: plan[2] for learner, plan in plans.items()}
+    dated = materialize_cohort(schedules, args.start_date, availability, holidays)
+    if args.spaced_review:
+        dated = apply_cohort_spaced_review(dated, load_review_book(args))
+    write_cohort_dataset(dated, args.cohort_dataset)
+
+
+def main() -> None:
+    args = parse_args()
+    curriculum = load_curriculum(args.curriculum) if args.curriculum else None
+    schedule = build_learner_schedule(
+        args, curriculum, args.minutes_per_week, args.focus
+    )
+    if args.curriculum:
+        title = "Curriculum schedule"
+    elif args.ai_personalized:
         title = "AI-personalized schedule"
     else:
-        schedule = build_schedule()
         title = "AI-generated schedule draft (mockup)"
 
-    output = f"{title}\n" + render_schedule(schedule)
+    rows = schedule
+    holidays = load_holidays(args.holidays) if args.holidays else ()
+    if args.start_date:
+        rows = materialize_dates(schedule, args.start_date, args.weekdays, holidays)
+
+    if args.spaced_review:
+        # Dated rows are planned on their real dates; undated ones from today.
+        rows = apply_spaced_review(
+            rows,
+            load_review_book(args),
+            learner=args.learner,
+            start_day=date.today().toordinal(),
+        )
+
+    # Keep stdout clean for machine-readable formats streamed there.
+    status = sys.stderr if args.format != "markdown" and not args.output else sys.stdout
+
+    if args.format == "jsonl":
+        export_schedule_to_jsonl(rows, args.output)
+    elif args.format == "csv":
+        export_schedule_to_csv(rows, args.output)
+    else:
+        table = render_dated_schedule(rows) if args.start_date else render_schedule(rows)
+        output = f"{title}\n" + table
+        if args.output:
+            args.output.write_text(output, encoding="utf-8")
+        else:
+            print(output)
 
     if args.output:
-        args.output.write_text(output, encoding="utf-8")
-        print(f"Saved schedule to {args.output}")
+        print(f"Saved schedule to {args.output}", file=status)
 
     if args.excel:
-        export_schedule_to_excel(schedule, args.excel)
-        print(f"Saved schedule to {args.excel}")
+        export_schedule_to_excel(rows, args.excel)
+        print(f"Saved schedule to {args.excel}", file=status)
+
+    if args.ics:
+        export_schedule_to_ics(
+            rows,
+            args.ics,
+            learner=args.learner,
+            start=args.start_date or date.today(),
+            manifest_path=args.ics_manifest,
+            changes_only=args.ics_changes_only,
+        )
+        print(f"Saved schedule to {args.ics}", file=status)
+
+    if args.cohort_plans:
+        write_cohort(args, curriculum, holidays)
+        print(f"Saved cohort to {args.cohort_dataset}", file=status)
+    elif args.cohort_dataset:
+        write_cohort_dataset({args.learner: rows}, args.cohort_dataset)
+        print(f"Saved schedule to {args.cohort_dataset}", file=status)
 
-    if not args.output:
-        print(output)
+    if args.fingerprints:
+        # One directory can collect a whole cohort: each run updates its own learner.
+        fingerprints = schedule_fingerprints(rows)
+        update_fingerprints(args.fingerprints, args.learner, fingerprints)
+        print(f"Saved fingerprints to {args.fingerprints}", file=status)
 
 
 if __name__ == "__main__":